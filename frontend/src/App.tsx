@@ -264,6 +264,12 @@ export default function App() {
         });
         if (run.status === "running") setRlmOpen(true);
       }
+      if (msg.event === "rlm_steps") {
+        const { id, steps } = msg.data as { id: string; steps: RlmStep[] };
+        setRlmRuns((prev) =>
+          prev.map((r) => (r.id === id ? { ...r, steps: [...r.steps, ...steps] } : r))
+        );
+      }
       if (msg.event === "conversation") {
         if (msg.data.state === "waiting") {
           setConversing(true);
@@ -1,16 +1,20 @@
 """The thinking loop — the heart of the creature."""
 
 import asyncio
+import heapq
 import json
 import logging
 import os
 import random
-from datetime import datetime, date
+import re
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
 
 from myxo.config import config
 from myxo.memory import MemoryStream
 from myxo.prompts import main_system_prompt, pick_mood, REFLECTION_PROMPT, PLANNING_PROMPT, FOCUS_NUDGE, JOURNAL_PROMPT
-from myxo.fold_client import evaluate as fold_evaluate, evaluate_long as fold_evaluate_long, check_session_fresh, kill_daemon as fold_kill_daemon
+from myxo.fold_client import evaluate as fold_evaluate, evaluate_long as fold_evaluate_long, evaluate_many as fold_evaluate_many, check_session_fresh, kill_daemon as fold_kill_daemon
 
 ARTIFACTS_FILENAME = "fold_artifacts.jsonl"
 
@@ -18,68 +22,215 @@ logger = logging.getLogger("myxo.brain")
 
 LOG_PATH = os.path.join(os.path.dirname(__file__), "..", "myxo.log.jsonl")
 
+# The quoted output string of an rlm2-run-result: everything up to the first
+# unescaped quote (or the end, if unterminated); any backslash escape drops
+# the backslash
+_RLM_STRING_RE = re.compile(r'"((?:[^"\\]|\\[\s\S]?)*)')
+_RLM_UNESCAPE_RE = re.compile(r'\\([\s\S])')
 
-def _serialize_input(input_list: list) -> list:
-    """Convert input_list to JSON-safe dicts for broadcasting."""
+# JSONL logs are written and re-read every cycle — use orjson when it's
+# installed. orjson.JSONDecodeError subclasses json.JSONDecodeError.
+try:
+    import orjson
+
+    def _jsonl_line(entry) -> bytes:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _jsonl_line(entry) -> bytes:
+        return (json.dumps(entry) + "\n").encode()
+
+    _json_loads = json.loads
+
+# Fold results that count as failures even without an "Error:" prefix
+_NOT_FOUND_RE = re.compile(r"not found|not bound", re.IGNORECASE)
+
+
+def _is_error_result(result: str) -> bool:
+    return result.startswith("Error:") or _NOT_FOUND_RE.search(result) is not None
+
+
+# Eval timeouts in Fold results (a hung worker) — these feed the circuit breaker
+_FOLD_EVAL_TIMEOUT_RE = re.compile(r"eval (?:RLM run )?timed out")
+
+# Scheme string-literal escaping, one pass via str.translate
+_SCHEME_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+
+def _ser_function_call(item) -> dict:
+    return {
+        "type": "function_call",
+        "name": item.name,
+        "arguments": item.arguments,
+        "call_id": item.call_id,
+    }
+
+
+def _ser_input_message(item) -> dict:
+    return {
+        "type": "message",
+        "role": getattr(item, "role", "assistant"),
+        "content": " ".join(c.text for c in item.content if hasattr(c, "text")),
+    }
+
+
+def _ser_output_message(item) -> dict | None:
+    content_parts = []
+    for c in item.content:
+        if hasattr(c, "text"):
+            if c.text:
+                content_parts.append({"type": "text", "text": c.text})
+        else:
+            content_parts.append({"type": getattr(c, "type", "unknown")})
+    # Skip messages with no actual text content
+    if content_parts:
+        return {"type": "message", "content": content_parts}
+    return None
+
+
+# SDK item type -> JSON-safe dict (None means drop the item)
+_INPUT_HANDLERS = {
+    "function_call": _ser_function_call,
+    "message": _ser_input_message,
+}
+_OUTPUT_HANDLERS = {
+    "function_call": _ser_function_call,
+    "message": _ser_output_message,
+}
+
+
+def _serialize_items(items, handlers: dict) -> list:
     result = []
-    for item in input_list:
+    for item in items:
         if isinstance(item, dict):
             result.append(item)
-        elif hasattr(item, "type"):
-            # SDK object — convert based on type
-            if item.type == "function_call":
-                result.append({
-                    "type": "function_call",
-                    "name": item.name,
-                    "arguments": item.arguments,
-                    "call_id": item.call_id,
-                })
-            elif item.type == "message":
-                parts = []
-                for c in item.content:
-                    if hasattr(c, "text"):
-                        parts.append(c.text)
-                result.append({
-                    "type": "message",
-                    "role": getattr(item, "role", "assistant"),
-                    "content": " ".join(parts),
-                })
-            else:
-                result.append({"type": item.type})
-        else:
+            continue
+        if not hasattr(item, "type"):
             result.append({"type": "unknown", "repr": str(item)[:200]})
+            continue
+        h = handlers.get(item.type)
+        if h is None:
+            result.append({"type": item.type})
+        else:
+            d = h(item)
+            if d is not None:
+                result.append(d)
     return result
 
 
+# datetime.now().isoformat(), with the date/time part formatted once per
+# second — events, API calls and artifacts arrive in bursts within a cycle
+_ts_second: int | None = None
+_ts_prefix = ""
+
+
+def _now_iso() -> str:
+    global _ts_second, _ts_prefix
+    second, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    if second != _ts_second:
+        _ts_second = second
+        _ts_prefix = datetime.fromtimestamp(second).isoformat()
+    return f"{_ts_prefix}.{micros:06d}" if micros else _ts_prefix
+
+
+def _serialize_input(input_list: list) -> list:
+    """Convert input_list to JSON-safe dicts for broadcasting."""
+    return _serialize_items(input_list, _INPUT_HANDLERS)
+
+
 def _serialize_output(output) -> list:
     """Convert API response output items to JSON-safe dicts."""
-    items = []
+    return _serialize_items(output, _OUTPUT_HANDLERS)
+
+
+def _memory_bullets(memories: list[dict], limit: int = 200) -> str:
+    """One "- content" line per memory, content cut to limit chars."""
+    return "\n".join(["- " + m["content"][:limit] for m in memories])
+
+
+def _has_text(output: list) -> bool:
+    """True if any serialized message in output carries non-empty text."""
     for item in output:
-        if hasattr(item, "type"):
-            if item.type == "message":
-                content_parts = []
-                for c in item.content:
-                    if hasattr(c, "text") and c.text:
-                        content_parts.append({"type": "text", "text": c.text})
-                    elif not hasattr(c, "text"):
-                        content_parts.append({"type": getattr(c, "type", "unknown")})
-                # Skip messages with no actual text content
-                if content_parts:
-                    items.append({"type": "message", "content": content_parts})
-            elif item.type == "function_call":
-                items.append({
-                    "type": "function_call",
-                    "name": item.name,
-                    "arguments": item.arguments,
-                    "call_id": item.call_id,
-                })
-            else:
-                items.append({"type": item.type})
-        elif isinstance(item, dict):
-            items.append(item)
-        else:
-            items.append({"type": "unknown", "repr": str(item)[:200]})
-    return items
+        if isinstance(item, dict) and item.get("type") == "message":
+            for p in item.get("content") or ():
+                if isinstance(p, dict) and p.get("text"):
+                    return True
+    return False
+
+
+class _JsonlWriter:
+    """Appends JSON lines to one file from a background task.
+
+    write() only queues the entry, so the event loop never blocks on
+    serialization or disk. Whatever has queued up by the time the task runs
+    goes out as one write through a file handle kept open between batches.
+    Brains that log to the same file share one writer (see shared()), so
+    their lines go out in a single order.
+    """
+
+    MAX_BATCH = 256
+
+    _shared: dict[str, "_JsonlWriter"] = {}  # realpath -> writer
+
+    def __init__(self, path: str):
+        self.path = path
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self._file = None
+
+    @classmethod
+    def shared(cls, path: str) -> "_JsonlWriter":
+        """The process-wide writer for path, created on first use."""
+        key = os.path.realpath(path)
+        writer = cls._shared.get(key)
+        if writer is None:
+            writer = cls._shared[key] = cls(path)
+        return writer
+
+    def write(self, entry: dict):
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._drain())
+        self._queue.put_nowait(entry)
+
+    async def _drain(self):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.MAX_BATCH and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await asyncio.to_thread(self._append, batch)
+            except Exception as e:
+                logger.error(f"Failed to append to {self.path}: {e}")
+            for _ in batch:
+                self._queue.task_done()
+
+    def _append(self, batch: list[dict]):
+        blob = b"".join(map(_jsonl_line, batch))
+        if self._file is None:
+            self._file = open(self.path, "ab")
+        self._file.write(blob)
+        self._file.flush()
+
+    async def flush(self):
+        """Wait until everything queued so far is on disk."""
+        if self._task is not None and not self._task.done():
+            await self._queue.join()
+
+    async def aclose(self):
+        """Flush everything queued, then stop the task and close the file.
+
+        A later write() starts a fresh task and reopens the file, so closing a
+        shared writer doesn't break the brains still using it.
+        """
+        if self._task is not None and not self._task.done():
+            await self._queue.join()
+            self._task.cancel()
+        self._task = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
 
 
 class Brain:
@@ -94,8 +245,9 @@ class Brain:
         "center": {"x": 5, "y": 5},
     }
 
-    # Tiles the creature cannot walk on (from Smallville collision layer)
-    _BLOCKED: set[tuple[int, int]] = set()
+    # Tiles the creature cannot walk on (from Smallville collision layer),
+    # one bit per tile at y * 12 + x
+    _BLOCKED_BITS: int = 0
 
     @staticmethod
     def _init_blocked():
@@ -114,24 +266,29 @@ class Brain:
             "XX...X.....X",  # row 10
             "X....X......",  # row 11
         ]
-        b = set()
+        bits = 0
         for y, row in enumerate(collision_rows):
             for x, ch in enumerate(row):
                 if ch == "X":
-                    b.add((x, y))
-        return b
+                    bits |= 1 << (y * 12 + x)
+        return bits
+
+    # Event types replayed into the model's context each cycle
+    _CONTEXT_EVENT_TYPES = frozenset({"thought", "tool_summary", "reflection"})
 
     # File extensions we can read as text
-    _TEXT_EXTS = {".txt", ".md", ".py", ".json", ".csv", ".yaml", ".yml",
-                  ".toml", ".js", ".ts", ".html", ".css", ".sh", ".log"}
-    _PDF_EXTS = {".pdf"}
+    _TEXT_EXTS = frozenset({".txt", ".md", ".py", ".json", ".csv", ".yaml", ".yml",
+                            ".toml", ".js", ".ts", ".html", ".css", ".sh", ".log"})
+    _PDF_EXTS = frozenset({".pdf"})
+    # Pages to extract at most for an inbox preview — single pages can take seconds
+    _MAX_PDF_PAGES = 10
     # Internal files the creature/system manages — never trigger alerts
-    _IGNORE_FILES = {"memory_stream.jsonl", "identity.json", "outbox.jsonl",
-                      "outbox_read.json", "fold_artifacts.jsonl", "memory_state.json"}
+    _IGNORE_FILES = frozenset({"memory_stream.jsonl", "memory_embeddings.f32", "identity.json", "outbox.jsonl",
+                               "outbox_read.json", "fold_artifacts.jsonl", "memory_state.json"})
     # Directories to skip during environment file scanning
-    _IGNORE_DIRS = {"session_logs", "journal", "logs"}
+    _IGNORE_DIRS = frozenset({"session_logs", "journal", "logs"})
     # Internal files that live in the root but shouldn't trigger inbox alerts
-    _INTERNAL_ROOT_FILES = {"projects.md"}
+    _INTERNAL_ROOT_FILES = frozenset({"projects.md"})
 
     # Planning frequency — plan every N think cycles
     PLAN_INTERVAL = 10
@@ -145,24 +302,38 @@ class Brain:
     # Fold session circuit breaker — kill daemon after this many consecutive timeouts
     FOLD_TIMEOUT_THRESHOLD = 3
 
+    # Background RLM runs allowed at once
+    MAX_CONCURRENT_RLM = 2
+
+    # Reflection insights stored as memories per reflection
+    MAX_REFLECTION_INSIGHTS = 10
+
     def __init__(self, identity: dict, env_path: str, provider=None, creature_config: dict = None):
         self.identity = identity
+        # Fold session name and Scheme-escaped creature name — fixed for the run
+        self._session = f"myxo-{identity['name'].lower()}"
+        self._escaped_name = Brain._scheme_escape(identity["name"])
         self.env_path = env_path
         self.provider = provider
         self.creature_config = creature_config or {}
-        self.events: list[dict] = []
-        self.api_calls: list[dict] = []
+        # Bounded in-memory history — the deques drop the oldest entries themselves
+        self.events: deque[dict] = deque(maxlen=500)
+        self.api_calls: deque[dict] = deque(maxlen=50)
+        self._last_thought: str | None = None  # text of the latest "thought" event
+        # The events _build_input replays as context, kept as they're emitted
+        self._recent_context: deque[dict] = deque(maxlen=config["max_thoughts_in_context"])
         self.thought_count: int = 0
         self.state: str = "idle"
         self.running: bool = False
         self._ws_clients: set = set()
         self.stream: MemoryStream | None = None  # loaded in run()
         self.position = {"x": 5, "y": 5}
-        if not Brain._BLOCKED:
-            Brain._BLOCKED = Brain._init_blocked()
+        if not Brain._BLOCKED_BITS:
+            Brain._BLOCKED_BITS = Brain._init_blocked()
 
         # File tracking — populated in run()
         self._seen_env_files: set[str] = set()
+        self._dir_listings: dict[str, tuple[int, list[str], list[str]]] = {}  # rel dir -> (mtime_ns, files, subdirs)
         self._inbox_pending: list[dict] = []
 
         # BBS issues created this run — exposed via /api/bbs
@@ -170,10 +341,18 @@ class Brain:
 
         # RLM runs this session — exposed via /api/rlm
         self._rlm_runs: list[dict] = []
+        self._rlm_tasks: dict[str, asyncio.Task] = {}  # run_id -> background run
+        self._rlm_results: dict[str, str] = {}  # finished runs not yet collected
 
         # Planning state
         self._cycles_since_plan: int = 0
         self._current_focus: str = ""
+        # projects.md as of (mtime_ns, size) -> (contents, current focus)
+        self._projects_cache: tuple[tuple[int, int], tuple[str | None, str]] | None = None
+
+        # Tail of fold_artifacts.jsonl, read incrementally
+        self._recent_artifacts: deque[dict] = deque(maxlen=50)
+        self._artifacts_offset: int = 0
 
         # Focus mode
         self._focus_mode: bool = False
@@ -194,7 +373,7 @@ class Brain:
         self._mood_duration: int = 5  # re-pick after this many think cycles
 
         # Cross-cycle error tracking — prevents fixation loops
-        self._persistent_errors: dict[str, int] = {}  # error_key -> count across cycles
+        self._persistent_errors: OrderedDict[str, int] = OrderedDict()  # error_key -> count across cycles, LRU
 
         # Session logging — toggleable trace capture for SFT/RL
         self._session_log_enabled: bool = False
@@ -202,9 +381,29 @@ class Brain:
         self._session_log_file = None  # open file handle
 
         # Journal state — auto-captured cycle metadata + periodic synthesis
-        self._journal_tags: list[dict] = []
+        self._journal_tags: deque[dict] = deque(maxlen=20)
         self._cycles_since_journal: int = 0
 
+        # Tool name -> async handler(args); fold is handled inline in _think_once
+        self._tool_handlers = {
+            "move": self._handle_move,
+            "respond": self._handle_respond,
+            "bbs": self._handle_bbs,
+            "restart_fold": self._handle_restart_fold,
+            "rlm": self._handle_rlm,
+            "rlm_status": self._handle_rlm_status,
+            "ask_librarian": self._handle_ask_librarian,
+        }
+
+        # Fixed paths under environment/, joined once
+        self._artifacts_path = os.path.join(env_path, ARTIFACTS_FILENAME)
+        self._projects_path = os.path.join(env_path, "projects.md")
+        self._journal_dir = os.path.join(env_path, "journal")
+
+        # Append-only logs, written off the event loop
+        self._artifact_writer = _JsonlWriter.shared(self._artifacts_path)
+        self._api_log_writer = _JsonlWriter.shared(LOG_PATH)
+
     # --- Helpers ---
 
     def _record_fold_artifact(self, expression: str, result: str):
@@ -217,36 +416,38 @@ class Brain:
             return
 
         artifact = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "expression": expression[:500],
             "result_preview": result[:200],
             "result_length": len(result),
         }
-        artifacts_path = os.path.join(self.env_path, ARTIFACTS_FILENAME)
-        try:
-            with open(artifacts_path, "a") as f:
-                f.write(json.dumps(artifact) + "\n")
-        except Exception as e:
-            logger.error(f"Failed to record artifact: {e}")
+        self._artifact_writer.write(artifact)
 
-    def _load_recent_artifacts(self, n: int = 10) -> list[dict]:
-        """Load the last N Fold artifacts for context."""
-        artifacts_path = os.path.join(self.env_path, ARTIFACTS_FILENAME)
-        if not os.path.isfile(artifacts_path):
-            return []
-        entries = []
+    async def _load_recent_artifacts(self, n: int = 10) -> list[dict]:
+        """Load the last N Fold artifacts for context.
+
+        Keeps the tail of the artifact log in memory and only parses lines
+        appended since the last call. Artifacts still queued are flushed first.
+        """
+        await self._artifact_writer.flush()
+        artifacts_path = self._artifacts_path
         try:
-            with open(artifacts_path, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            entries.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            pass
-        except Exception:
-            pass
-        return entries[-n:]
+            size = os.stat(artifacts_path).st_size
+        except OSError:
+            return []
+        if size < self._artifacts_offset:
+            # Log was truncated or replaced — start over
+            self._recent_artifacts.clear()
+            self._artifacts_offset = 0
+        lines, self._artifacts_offset = self._read_new_lines(artifacts_path, self._artifacts_offset)
+        for line in lines:
+            line = line.strip()
+            if line:
+                try:
+                    self._recent_artifacts.append(_json_loads(line))
+                except json.JSONDecodeError:
+                    pass
+        return list(self._recent_artifacts)[-n:]
 
     def _read_file(self, rel_path: str) -> str | None:
         """Read a file from environment/, return contents or None."""
@@ -257,9 +458,54 @@ class Brain:
         except (FileNotFoundError, IsADirectoryError):
             return None
 
+    def _write_plan_outputs(self, plan_body: str, log_path: str | None, log_text: str | None):
+        """Write projects.md and append the daily log entry (runs in a worker thread)."""
+        try:
+            with open(self._projects_path, "w") as f:
+                f.write(plan_body)
+        except Exception as e:
+            logger.error(f"Failed to write projects.md: {e}")
+        if log_path:
+            try:
+                self._append_text(log_path, log_text)
+            except Exception as e:
+                logger.error(f"Failed to write daily log: {e}")
+
+    @staticmethod
+    def _append_text(path: str, text: str):
+        """Append text to a file, creating its directory if needed.
+
+        A one-shot raw O_APPEND write — no buffered file object for a few hundred bytes.
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = memoryview(text.encode("utf-8"))
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | os.O_CLOEXEC, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+    def _read_projects(self) -> tuple[str | None, str]:
+        """(contents, current focus) of projects.md, re-read only when it has changed."""
+        try:
+            st = os.stat(self._projects_path)
+        except OSError:
+            return None, ""
+        key = (st.st_mtime_ns, st.st_size)
+        if self._projects_cache is not None and self._projects_cache[0] == key:
+            return self._projects_cache[1]
+        content = self._read_file("projects.md")
+        projects = (content, self._parse_current_focus(content))
+        self._projects_cache = (key, projects)
+        return projects
+
     def _load_current_focus(self) -> str:
         """Extract current focus from projects.md if it exists."""
-        content = self._read_file("projects.md")
+        return self._read_projects()[1]
+
+    @staticmethod
+    def _parse_current_focus(content: str | None) -> str:
         if not content:
             return ""
         # Extract the "# Current Focus" section
@@ -279,16 +525,7 @@ class Brain:
 
     def _list_env_files(self) -> list[str]:
         """List all files in environment/ (relative paths)."""
-        env_root = self.env_path
-        files = []
-        for dirpath, dirnames, filenames in os.walk(env_root):
-            dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in Brain._IGNORE_DIRS]
-            for fname in filenames:
-                if fname.startswith(".") or fname in Brain._IGNORE_FILES:
-                    continue
-                rel = os.path.relpath(os.path.join(dirpath, fname), env_root)
-                files.append(rel)
-        return sorted(files)
+        return sorted(self._scan_env_files())
 
     # --- WebSocket / events ---
 
@@ -305,7 +542,7 @@ class Brain:
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         path = os.path.join(log_dir, f"{ts}.jsonl")
         self._session_log_path = path
-        self._session_log_file = open(path, "a")
+        self._session_log_file = open(path, "ab")
         self._session_log_enabled = True
         # Write a header entry so we know what creature/model this trace is from
         header = {
@@ -315,7 +552,7 @@ class Brain:
             "model": self.creature_config.get("model", config.get("model", "unknown")),
             "thought_count_at_start": self.thought_count,
         }
-        self._session_log_file.write(json.dumps(header) + "\n")
+        self._session_log_file.write(_jsonl_line(header))
         self._session_log_file.flush()
         logger.info(f"Session logging started: {path}")
         return path
@@ -332,7 +569,7 @@ class Brain:
                     "timestamp": datetime.now().isoformat(),
                     "thought_count_at_stop": self.thought_count,
                 }
-                self._session_log_file.write(json.dumps(footer) + "\n")
+                self._session_log_file.write(_jsonl_line(footer))
                 self._session_log_file.close()
             except Exception:
                 pass
@@ -346,32 +583,35 @@ class Brain:
         if not self._session_log_enabled or not self._session_log_file:
             return
         try:
-            self._session_log_file.write(json.dumps(message) + "\n")
+            self._session_log_file.write(_jsonl_line(message))
             self._session_log_file.flush()
         except Exception:
             pass
 
     async def _broadcast(self, message: dict):
-        dead = set()
-        for ws in self._ws_clients:
-            try:
-                await ws.send_json(message)
-            except Exception:
-                dead.add(ws)
-        self._ws_clients -= dead
+        # Serialize once (same encoding as WebSocket.send_json), then send to
+        # every client concurrently — one slow socket shouldn't delay the rest
+        clients = list(self._ws_clients)
+        if clients:
+            payload = json.dumps(message, separators=(",", ":"), ensure_ascii=False, default=str)
+            results = await asyncio.gather(*(ws.send_text(payload) for ws in clients),
+                                           return_exceptions=True)
+            self._ws_clients.difference_update(
+                ws for ws, r in zip(clients, results) if isinstance(r, Exception))
         self._write_session_log(message)
 
     async def _emit(self, event_type: str, **data):
         entry = {
             "type": event_type,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "thought_number": self.thought_count,
             **data,
         }
         self.events.append(entry)
-        # Cap in-memory events to prevent unbounded growth
-        if len(self.events) > 500:
-            self.events = self.events[-500:]
+        if event_type in Brain._CONTEXT_EVENT_TYPES:
+            self._recent_context.append(entry)
+            if event_type == "thought":
+                self._last_thought = data.get("text")
         await self._broadcast({"event": "entry", "data": entry})
         text = data.get("text", data.get("command", data.get("content", "")))
         logger.info(f"[{event_type}] {str(text)[:120]}")
@@ -380,7 +620,7 @@ class Brain:
                              response: dict, is_reflection: bool = False,
                              is_planning: bool = False):
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "instructions": instructions,
             "input": _serialize_input(input_list),
             "output": _serialize_output(response["output"]),
@@ -388,33 +628,20 @@ class Brain:
             "is_planning": is_planning,
         }
         self.api_calls.append(entry)
-        # Cap in-memory API snapshots to prevent superlinear memory growth
-        if len(self.api_calls) > 50:
-            self.api_calls = self.api_calls[-50:]
         await self._broadcast({"event": "api_call", "data": entry})
 
         # Append to log file (project root, outside environment)
         # Skip entries with no text content (tool-only responses) to avoid log bloat
-        has_text = any(
-            isinstance(item, dict)
-            and item.get("type") == "message"
-            and any(
-                isinstance(p, dict) and p.get("text")
-                for p in (item.get("content") or [])
-            )
-            for item in entry.get("output", [])
-        )
-        if has_text:
-            try:
-                with open(LOG_PATH, "a") as f:
-                    f.write(json.dumps(entry) + "\n")
-            except Exception:
-                pass
+        if _has_text(entry["output"]):
+            self._api_log_writer.write(entry)
 
     # --- Movement ---
 
     def _is_blocked(self, x: int, y: int) -> bool:
-        return (x, y) in Brain._BLOCKED
+        """Collision check; anything off the 12x12 board counts as blocked."""
+        if 0 <= x < 12 and 0 <= y < 12:
+            return bool((Brain._BLOCKED_BITS >> (y * 12 + x)) & 1)
+        return True
 
     async def _handle_move(self, args: dict) -> str:
         location = args.get("location", "center")
@@ -431,7 +658,7 @@ class Brain:
         dy = random.choice([-1, 0, 1])
         nx = self.position["x"] + dx
         ny = self.position["y"] + dy
-        if not self._is_blocked(nx, ny) and 0 <= nx <= 11 and 0 <= ny <= 11:
+        if not self._is_blocked(nx, ny):
             self.position = {"x": nx, "y": ny}
             await self._broadcast({"event": "position", "data": self.position})
 
@@ -470,9 +697,9 @@ class Brain:
     @staticmethod
     def _scheme_escape(s: str) -> str:
         """Escape a string for embedding in a Scheme string literal."""
-        return s.replace("\\", "\\\\").replace('"', '\\"')
+        return s.translate(_SCHEME_ESCAPES)
 
-    async def _handle_restart_fold(self) -> str:
+    async def _handle_restart_fold(self, args: dict) -> str:
         """Handle the restart_fold tool — kill and restart the Fold daemon."""
         logger.warning(f"{self.identity['name']} requested Fold daemon restart")
 
@@ -486,7 +713,7 @@ class Brain:
         await asyncio.sleep(1.5)
 
         # Verify restart by pinging — _ensure_daemon() auto-starts if needed
-        session = f"myxo-{self.identity['name'].lower()}"
+        session = self._session
         ping = await asyncio.to_thread(fold_evaluate, "(+ 1 1)", session)
 
         # Reset session tracking state
@@ -509,7 +736,6 @@ class Brain:
         issue_type = args.get("type", "note")
         priority = args.get("priority", 3)
         labels = args.get("labels", [])
-        name = self.identity["name"]
 
         esc = self._scheme_escape
         labels_sexp = " ".join(labels) if labels else ""
@@ -518,11 +744,11 @@ class Brain:
             f"'type '{issue_type} "
             f"'priority {priority} "
             f"'labels '({labels_sexp}) "
-            f"'created-by \"{esc(name)}\" "
+            f"'created-by \"{self._escaped_name}\" "
             f"'description \"{esc(description)}\")"
         )
 
-        session = f"myxo-{name.lower()}"
+        session = self._session
         result = await asyncio.to_thread(fold_evaluate, expr, session)
 
         # Parse issue ID from result (e.g. "Created fold-abc1")
@@ -552,72 +778,47 @@ class Brain:
 
         return result
 
+    @staticmethod
+    def _strip_fold_noise(result: str) -> str:
+        """Drop Fold boot output — the daemon prints stdout before "=> value"."""
+        idx = result.rfind("\n=> ")
+        return result[idx + 4:] if idx >= 0 else result
+
     @staticmethod
     def _parse_rlm_result(result: str) -> tuple[str, str]:
         """Parse an RLM S-expression result into (status, output_text)."""
         if result.startswith("Error:"):
             return "error", result
 
+        # Work by index into result — it can be megabytes, so no slicing copies
         prefix = "(rlm2-run-result "
         idx = result.find(prefix)
         if idx < 0:
             return "unknown", result[:300]
 
-        rest = result[idx + len(prefix):]
         # Extract status word (completed, exhausted, etc.)
-        space_idx = rest.find(" ")
+        start = idx + len(prefix)
+        space_idx = result.find(" ", start)
         if space_idx < 0:
             return "unknown", result[:300]
-        status = rest[:space_idx]
-        rest = rest[space_idx + 1:]
+        status = result[start:space_idx]
+        start = space_idx + 1
 
         # Extract the quoted output string (handles escaped quotes)
-        if not rest.startswith('"'):
-            return status, rest[:300]
-
-        chars = []
-        i = 1
-        while i < len(rest):
-            if rest[i] == '\\' and i + 1 < len(rest):
-                chars.append(rest[i + 1])
-                i += 2
-            elif rest[i] == '"':
-                break
-            else:
-                chars.append(rest[i])
-                i += 1
-        return status, ''.join(chars)
-
-    async def _handle_rlm(self, args: dict) -> str:
-        """Handle the rlm tool — launch a deep exploration sub-agent in the Fold."""
-        task = args.get("task", "")
-        seed_input = args.get("input", "")
-        name = self.identity["name"]
-        import time as _time
-        run_id = f"rlm-{int(_time.time())}"
-        started_at = datetime.now().isoformat()
+        if not result.startswith('"', start):
+            return status, result[start:start + 300]
 
-        # Track and broadcast start
-        run_data = {
-            "id": run_id,
-            "task": task,
-            "status": "running",
-            "output": "",
-            "steps": [],
-            "timestamp": started_at,
-        }
-        self._rlm_runs.append(run_data)
+        body = _RLM_STRING_RE.match(result, start).group(1)
+        if "\\" in body:
+            body = _RLM_UNESCAPE_RE.sub(r"\1", body)
+        return status, body
 
-        await self._broadcast({
-            "event": "activity",
-            "data": {"type": "deep_exploration", "detail": f"RLM: {task[:60]}"},
-        })
-        await self._broadcast({
-            "event": "rlm",
-            "data": {**run_data},
-        })
+    def _rlm_expr(self, run_id: str, system_prompt: str, task: str, seed: str,
+                  max_steps: int, max_fuel: int, max_tokens: int) -> tuple[str, str, int]:
+        """Build the Fold expression for an rlm2 run against the configured provider.
 
-        # Build the provider config for the Fold-side RLM
+        Returns (expression, progress file, timeout in seconds).
+        """
         rlm_base = self.creature_config.get("rlm_base_url")
         model = self.creature_config.get("rlm_model") or self.creature_config.get("model", "moonshotai/kimi-k2.5")
 
@@ -630,17 +831,13 @@ class Brain:
             endpoint = base_url.rstrip("/") + "/chat/completions"
             api_key_scheme = '"OPENAI_API_KEY"'
 
-        esc = self._scheme_escape
-        seed_escaped = esc(seed_input) if seed_input else ""
-
-        max_steps = self.creature_config.get("rlm_max_steps", 12)
-        max_tokens = self.creature_config.get("rlm_max_tokens", 1024)
         per_step = 20 if api_key_scheme == "#f" else 45
-        rlm_timeout = per_step * max_steps + 30
+        timeout = per_step * max_steps + 30
 
         # Progress file for live trajectory updates
         progress_file = f"/tmp/rlm2-progress-{run_id}.log"
 
+        esc = self._scheme_escape
         expr = (
             '(begin '
             '(set-top-level-value! \'*meta-quiet* #t) '
@@ -651,93 +848,199 @@ class Brain:
             f'  "{esc(model)}" '
             f'  {api_key_scheme} '
             f"  'openai)] "
-            f' [config (make-rlm2-config provider "" '
-            f'  {max_steps} 50000 2000 2 3 8000 #f {max_tokens})]) '
-            f'  (rlm2-run config "{esc(task)}" "{seed_escaped}")))'
+            f' [config (make-rlm2-config provider "{esc(system_prompt)}" '
+            f'  {max_steps} {max_fuel} 2000 2 3 8000 #f {max_tokens})]) '
+            f'  (rlm2-run config "{esc(task)}" "{esc(seed)}")))'
         )
+        return expr, progress_file, timeout
+
+    async def _handle_rlm(self, args: dict) -> str:
+        """Handle the rlm tool — launch a deep exploration sub-agent in the Fold."""
+        task = args.get("task", "")
+        seed_input = args.get("input", "")
+        running = sum(1 for t in self._rlm_tasks.values() if not t.done())
+        if running >= Brain.MAX_CONCURRENT_RLM:
+            return (f"Error: {running} RLM runs are already in progress. "
+                    "Check on them with rlm_status before starting another.")
+        run_id = f"rlm-{int(time.time())}"
+        if run_id in self._rlm_tasks:
+            run_id += f"-{len(self._rlm_tasks)}"
+        started_at = datetime.now().isoformat()
+
+        # Track and broadcast start
+        run_data = {
+            "id": run_id,
+            "task": task,
+            "status": "running",
+            "output": "",
+            "steps": [],
+            "timestamp": started_at,
+        }
+        self._rlm_runs.append(run_data)
 
-        session = f"myxo-{name.lower()}-{run_id}"
+        await self._broadcast({
+            "event": "activity",
+            "data": {"type": "deep_exploration", "detail": f"RLM: {task[:60]}"},
+        })
+        await self._broadcast({
+            "event": "rlm",
+            "data": {**run_data},
+        })
+
+        max_steps = self.creature_config.get("rlm_max_steps", 12)
+        max_tokens = self.creature_config.get("rlm_max_tokens", 1024)
+        expr, progress_file, rlm_timeout = self._rlm_expr(
+            run_id, "", task, seed_input, max_steps, 50000, max_tokens)
+
+        session = f"{self._session}-{run_id}"
         logger.info(f"RLM run starting (max {max_steps} steps, {rlm_timeout}s timeout, session={session}): {task[:80]}")
 
-        # Run evaluation in background, poll progress file for live updates
+        # Run in the background — the creature keeps thinking and collects
+        # the result later with rlm_status
+        self._rlm_tasks[run_id] = asyncio.create_task(
+            self._drain_rlm(run_data, expr, session, rlm_timeout, progress_file))
+        return (f"[RLM {run_id} started] It runs in the background and takes a couple "
+                "of minutes — keep working, and check on it with rlm_status.")
+
+    async def _drain_rlm(self, run_data: dict, expr: str, session: str,
+                         rlm_timeout: float, progress_file: str):
+        """Run one RLM evaluation to completion, streaming its progress to observers."""
+        run_id = run_data["id"]
+        task = run_data["task"]
         loop = asyncio.get_event_loop()
         eval_future = loop.run_in_executor(
             None, fold_evaluate_long, expr, session, rlm_timeout)
 
-        seen_lines = 0
-        while not eval_future.done():
-            await asyncio.sleep(1.5)
-            try:
-                with open(progress_file) as f:
-                    lines = f.readlines()
-                new_lines = lines[seen_lines:]
-                if new_lines:
-                    for line in new_lines:
-                        parts = line.strip().split("\t", 3)
-                        if len(parts) >= 4:
-                            step_entry = {
-                                "step": int(parts[0]),
-                                "action": parts[1],
-                                "ok": parts[2] == "ok",
-                                "note": parts[3],
-                            }
-                            run_data["steps"].append(step_entry)
-                    seen_lines = len(lines)
+        seen_bytes = 0
+        try:
+            while not eval_future.done():
+                await asyncio.sleep(1.5)
+                lines, seen_bytes = self._read_new_lines(progress_file, seen_bytes)
+                steps = [step for step in map(self._parse_rlm_step, lines) if step]
+                if steps:
+                    run_data["steps"].extend(steps)
+                    # Only the new steps — the full run went out at start and goes again at the end
                     await self._broadcast({
-                        "event": "rlm",
-                        "data": {**run_data},
+                        "event": "rlm_steps",
+                        "data": {"id": run_id, "steps": steps},
                     })
-            except (FileNotFoundError, ValueError):
-                pass
 
-        result = eval_future.result()
+            result = self._strip_fold_noise(eval_future.result())
 
-        # Strip Fold boot noise — daemon combines stdout with expression value
-        marker = "\n=> "
-        idx = result.rfind(marker)
-        if idx >= 0:
-            result = result[idx + len(marker):]
+            # Read any remaining progress lines (the last may lack a newline)
+            lines, _ = self._read_new_lines(progress_file, seen_bytes, final=True)
+            run_data["steps"].extend(step for step in map(self._parse_rlm_step, lines) if step)
 
-        # Read any remaining progress lines
-        try:
-            with open(progress_file) as f:
-                lines = f.readlines()
-            for line in lines[seen_lines:]:
-                parts = line.strip().split("\t", 3)
-                if len(parts) >= 4:
-                    run_data["steps"].append({
-                        "step": int(parts[0]),
-                        "action": parts[1],
-                        "ok": parts[2] == "ok",
-                        "note": parts[3],
-                    })
-            os.unlink(progress_file)
-        except (FileNotFoundError, ValueError):
-            pass
+            rlm_status, rlm_output = self._parse_rlm_result(result)
 
-        # Parse and broadcast completion
-        rlm_status, rlm_output = self._parse_rlm_result(result)
-        run_data["status"] = rlm_status
-        run_data["output"] = rlm_output[:500]
+            # Hold clean parsed output for rlm_status, not the raw S-expression
+            if rlm_status == "completed":
+                message = f"[RLM {run_id} completed] {rlm_output}"
+            elif rlm_status == "exhausted":
+                message = f"[RLM {run_id} exhausted — hit step limit] {rlm_output}"
+            elif rlm_status == "error":
+                message = f"[RLM {run_id} error] {rlm_output}"
+            else:
+                message = f"[RLM {run_id} {rlm_status}] {rlm_output}"
+            self._rlm_results[run_id] = message
+            run_data["status"] = rlm_status
+            run_data["output"] = rlm_output[:500]
 
-        await self._broadcast({
-            "event": "rlm",
-            "data": {**run_data},
-        })
+            if not result.startswith("Error:"):
+                self._record_fold_artifact(f"(rlm: {task[:200]})", result)
 
-        if not result.startswith("Error:"):
-            self._record_fold_artifact(f"(rlm: {task[:200]})", result)
+            logger.info(f"RLM run complete ({rlm_status}): {len(result)} chars, {len(run_data['steps'])} steps")
+
+            # Broadcast completion
+            await self._broadcast({
+                "event": "rlm",
+                "data": {**run_data},
+            })
+        except Exception as e:
+            logger.error(f"RLM run {run_id} failed: {e}")
+            # A failure after the result was recorded (e.g. the final broadcast) keeps it
+            if run_data["status"] == "running":
+                run_data["status"] = "error"
+                run_data["output"] = f"RLM run failed: {e}"[:500]
+                self._rlm_results[run_id] = f"[RLM {run_id} error] RLM run failed: {e}"
+                try:
+                    await self._broadcast({
+                        "event": "rlm",
+                        "data": {**run_data},
+                    })
+                except Exception:
+                    pass
+        finally:
+            try:
+                os.unlink(progress_file)
+            except FileNotFoundError:
+                pass
 
-        logger.info(f"RLM run complete ({rlm_status}): {len(result)} chars, {len(run_data['steps'])} steps")
+    async def _handle_rlm_status(self, args: dict) -> str:
+        """Handle the rlm_status tool — report on or collect a background RLM run."""
+        runs = [r for r in self._rlm_runs if r["id"] in self._rlm_tasks]  # not librarian runs
+        if not runs:
+            return "No RLM runs this session."
+        run_id = args.get("run_id", "").strip()
+        picked = ""
+        if run_id:
+            run = next((r for r in runs if r["id"] == run_id), None)
+            if run is None:
+                known = ", ".join(r["id"] for r in runs[-5:])
+                return f"Error: no RLM run {run_id}. Recent runs: {known}"
+        else:
+            # Most recent run whose result hasn't been collected yet
+            run = next((r for r in reversed(runs)
+                        if r["status"] == "running" or r["id"] in self._rlm_results), None)
+            if run is None:
+                known = ", ".join(r["id"] for r in runs[-5:])
+                return f"All RLM runs have been collected. Recent runs: {known}"
+            run_id = run["id"]
+            picked = f"(no run_id given — showing {run_id}, the latest uncollected run)\n"
+
+        if run["status"] == "running":
+            steps = run["steps"]
+            last = f" — last: {steps[-1]['action']} {steps[-1]['note'][:80]}" if steps else ""
+            return f"{picked}[RLM {run_id} still running — {len(steps)} steps so far{last}]"
+        message = self._rlm_results.pop(run_id, None)
+        return picked + (message or f"[RLM {run_id} {run['status']}] {run['output']}")
 
-        # Return clean parsed output to the model, not the raw S-expression
-        if rlm_status == "completed":
-            return f"[RLM completed] {rlm_output}"
-        elif rlm_status == "exhausted":
-            return f"[RLM exhausted — hit step limit] {rlm_output}"
-        elif rlm_status == "error":
-            return f"[RLM error] {rlm_output}"
-        return f"[RLM {rlm_status}] {rlm_output}"
+    @staticmethod
+    def _read_new_lines(path: str, offset: int, final: bool = False) -> tuple[list[str], int]:
+        """Read complete lines appended to path since byte offset.
+
+        Returns (lines, new_offset). A trailing partial line is left for the
+        next call unless final is set. Skips the open if the file hasn't grown.
+        """
+        try:
+            if os.stat(path).st_size <= offset:
+                return [], offset
+            with open(path, "rb") as f:
+                f.seek(offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return [], offset
+        if not final:
+            end = chunk.rfind(b"\n") + 1
+            chunk = chunk[:end]
+        return chunk.decode("utf-8", "replace").split("\n"), offset + len(chunk)
+
+    @staticmethod
+    def _parse_rlm_step(line: str) -> dict | None:
+        """Parse one tab-separated RLM progress line: step, action, ok|fail, note."""
+        parts = line.strip().split("\t", 3)
+        if len(parts) < 4:
+            return None
+        try:
+            step = int(parts[0])
+        except ValueError:
+            return None
+        return {
+            "step": step,
+            "action": parts[1],
+            "ok": parts[2] == "ok",
+            "note": parts[3],
+        }
 
     _LIBRARIAN_SYSTEM_PROMPT = (
         "You are a lattice librarian. Your job is to find functions, understand "
@@ -760,9 +1063,7 @@ class Brain:
         """Handle the ask_librarian tool — launch a search-specialized RLM sub-agent."""
         query = args.get("query", "")
         context = args.get("context", "")
-        name = self.identity["name"]
-        import time as _time
-        run_id = f"lib-{int(_time.time())}"
+        run_id = f"lib-{int(time.time())}"
         started_at = datetime.now().isoformat()
 
         # Track and broadcast start
@@ -785,51 +1086,19 @@ class Brain:
             "data": {**run_data},
         })
 
-        # Build provider config — same as RLM but with librarian system prompt
-        rlm_base = self.creature_config.get("rlm_base_url")
-        model = self.creature_config.get("rlm_model") or self.creature_config.get("model", "moonshotai/kimi-k2.5")
-
-        if rlm_base:
-            endpoint = rlm_base.rstrip("/") + "/chat/completions"
-            is_local = rlm_base.startswith("http://localhost") or rlm_base.startswith("http://127.")
-            api_key_scheme = "#f" if is_local else '"OPENAI_API_KEY"'
-        else:
-            base_url = self.creature_config.get("base_url", "https://openrouter.ai/api/v1")
-            endpoint = base_url.rstrip("/") + "/chat/completions"
-            api_key_scheme = '"OPENAI_API_KEY"'
-
-        esc = self._scheme_escape
-
         # Librarian-specific budgets: lighter than full RLM
         max_steps = self.creature_config.get("librarian_max_steps", 15)
         max_tokens = self.creature_config.get("librarian_max_tokens", 1024)
-        max_fuel = 30000
-        per_step = 20 if api_key_scheme == "#f" else 45
-        lib_timeout = per_step * max_steps + 30
 
         # Build seed input from query + context
         seed = query
         if context:
             seed = f"{query}\n\nContext: {context}"
 
-        progress_file = f"/tmp/rlm2-progress-{run_id}.log"
+        expr, progress_file, lib_timeout = self._rlm_expr(
+            run_id, self._LIBRARIAN_SYSTEM_PROMPT, query, seed, max_steps, 30000, max_tokens)
 
-        expr = (
-            '(begin '
-            '(set-top-level-value! \'*meta-quiet* #t) '
-            '(load "boundary/pipeline/rlm2-drive.ss") '
-            f'(set! *rlm2-progress-file* "{progress_file}") '
-            f'(let* ([provider (make-rlm-provider '
-            f'  "{esc(endpoint)}" '
-            f'  "{esc(model)}" '
-            f'  {api_key_scheme} '
-            f"  'openai)] "
-            f' [config (make-rlm2-config provider "{esc(self._LIBRARIAN_SYSTEM_PROMPT)}" '
-            f'  {max_steps} {max_fuel} 2000 2 3 8000 #f {max_tokens})]) '
-            f'  (rlm2-run config "{esc(query)}" "{esc(seed)}")))'
-        )
-
-        session = f"myxo-{name.lower()}-{run_id}"
+        session = f"{self._session}-{run_id}"
         logger.info(f"Librarian run starting (max {max_steps} steps, {lib_timeout}s timeout, session={session}): {query[:80]}")
 
         # Run evaluation in background, poll progress file for live updates
@@ -837,55 +1106,26 @@ class Brain:
         eval_future = loop.run_in_executor(
             None, fold_evaluate_long, expr, session, lib_timeout)
 
-        seen_lines = 0
+        seen_bytes = 0
         while not eval_future.done():
             await asyncio.sleep(1.5)
-            try:
-                with open(progress_file) as f:
-                    lines = f.readlines()
-                new_lines = lines[seen_lines:]
-                if new_lines:
-                    for line in new_lines:
-                        parts = line.strip().split("\t", 3)
-                        if len(parts) >= 4:
-                            step_entry = {
-                                "step": int(parts[0]),
-                                "action": parts[1],
-                                "ok": parts[2] == "ok",
-                                "note": parts[3],
-                            }
-                            run_data["steps"].append(step_entry)
-                    seen_lines = len(lines)
-                    await self._broadcast({
-                        "event": "rlm",
-                        "data": {**run_data},
-                    })
-            except (FileNotFoundError, ValueError):
-                pass
-
-        result = eval_future.result()
+            lines, seen_bytes = self._read_new_lines(progress_file, seen_bytes)
+            steps = [step for step in map(self._parse_rlm_step, lines) if step]
+            if steps:
+                run_data["steps"].extend(steps)
+                await self._broadcast({
+                    "event": "rlm_steps",
+                    "data": {"id": run_id, "steps": steps},
+                })
 
-        # Strip Fold boot noise
-        marker = "\n=> "
-        idx = result.rfind(marker)
-        if idx >= 0:
-            result = result[idx + len(marker):]
+        result = self._strip_fold_noise(eval_future.result())
 
-        # Read any remaining progress lines
+        # Read any remaining progress lines (the last may lack a newline)
+        lines, _ = self._read_new_lines(progress_file, seen_bytes, final=True)
+        run_data["steps"].extend(step for step in map(self._parse_rlm_step, lines) if step)
         try:
-            with open(progress_file) as f:
-                lines = f.readlines()
-            for line in lines[seen_lines:]:
-                parts = line.strip().split("\t", 3)
-                if len(parts) >= 4:
-                    run_data["steps"].append({
-                        "step": int(parts[0]),
-                        "action": parts[1],
-                        "ok": parts[2] == "ok",
-                        "note": parts[3],
-                    })
             os.unlink(progress_file)
-        except (FileNotFoundError, ValueError):
+        except FileNotFoundError:
             pass
 
         # Parse and broadcast completion
@@ -919,8 +1159,8 @@ class Brain:
             return
 
         # Gather context: recent tags + recent artifacts
-        tags = self._journal_tags[-10:]
-        artifacts = self._load_recent_artifacts(5)
+        tags = list(self._journal_tags)[-10:]
+        artifacts = await self._load_recent_artifacts(5)
 
         context_parts = ["Recent cycle metadata:"]
         for tag in tags:
@@ -943,24 +1183,24 @@ class Brain:
             journal_text = journal_response["text"] or ""
         except Exception as e:
             logger.error(f"Journal synthesis failed: {e}")
-            self._journal_tags = []
+            self._journal_tags.clear()
             self._cycles_since_journal = 0
             return
 
         if not journal_text.strip():
             logger.warning("Journal synthesis returned empty text")
-            self._journal_tags = []
+            self._journal_tags.clear()
             self._cycles_since_journal = 0
             return
 
         # Write to journal file
-        journal_dir = os.path.join(self.env_path, "journal")
-        os.makedirs(journal_dir, exist_ok=True)
-        journal_path = os.path.join(journal_dir, f"{date.today().isoformat()}.md")
-        now_str = datetime.now().strftime("%I:%M %p")
+        now = datetime.now()
+        journal_path = os.path.join(self._journal_dir, f"{now.date().isoformat()}.md")
+        now_str = now.strftime("%I:%M %p")
         try:
-            with open(journal_path, "a") as f:
-                f.write(f"\n## {now_str}\n{journal_text}\n")
+            await asyncio.to_thread(
+                self._append_text, journal_path, f"\n## {now_str}\n{journal_text}\n"
+            )
         except Exception as e:
             logger.error(f"Failed to write journal: {e}")
 
@@ -982,7 +1222,7 @@ class Brain:
         self._seen_env_files = self._scan_env_files()
 
         # Reset
-        self._journal_tags = []
+        self._journal_tags.clear()
         self._cycles_since_journal = 0
 
         logger.info(f"Journal entry written ({len(journal_text)} chars)")
@@ -1007,23 +1247,72 @@ class Brain:
     # --- File detection ---
 
     def _scan_env_files(self) -> set[str]:
-        """Get all file paths in environment/ (relative), excluding internal files."""
-        env_root = self.env_path
+        """Get all file paths in environment/ (relative), excluding internal files.
+
+        Directory listings are cached by the directory's mtime, so a scan of an
+        unchanged tree only stats each directory instead of re-reading it.
+        """
         files = set()
-        for dirpath, dirnames, filenames in os.walk(env_root):
-            dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in Brain._IGNORE_DIRS]
-            for fname in filenames:
-                if fname.startswith(".") or fname in Brain._IGNORE_FILES:
-                    continue
-                rel = os.path.relpath(os.path.join(dirpath, fname), env_root)
-                files.add(rel)
+        listings = self._dir_listings
+        visited = set()
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            full = os.path.join(self.env_path, rel_dir)
+            try:
+                mtime = os.stat(full).st_mtime_ns
+            except OSError:
+                continue
+            visited.add(rel_dir)
+            cached = listings.get(rel_dir)
+            if cached is not None and cached[0] == mtime:
+                dir_files, subdirs = cached[1], cached[2]
+            else:
+                dir_files, subdirs = self._list_dir(full, rel_dir)
+                # A change in the same clock tick as this listing wouldn't move
+                # the mtime — only trust listings of directories that have settled
+                if time.time_ns() - mtime > 2_000_000_000:
+                    listings[rel_dir] = (mtime, dir_files, subdirs)
+                else:
+                    listings.pop(rel_dir, None)
+            files.update(dir_files)
+            stack.extend(subdirs)
+        for rel_dir in listings.keys() - visited:
+            del listings[rel_dir]
         return files
 
+    @staticmethod
+    def _list_dir(full: str, rel_dir: str) -> tuple[list[str], list[str]]:
+        """One directory's (files, subdirectories) as environment-relative paths."""
+        dir_files, subdirs = [], []
+        try:
+            with os.scandir(full) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith("."):
+                        continue
+                    rel = os.path.join(rel_dir, name)
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        # Like os.walk: symlinked directories are not descended
+                        if name not in Brain._IGNORE_DIRS and not entry.is_symlink():
+                            subdirs.append(rel)
+                    elif name not in Brain._IGNORE_FILES:
+                        dir_files.append(rel)
+        except OSError:
+            pass
+        return dir_files, subdirs
+
     def _check_new_files(self) -> list[dict]:
         """Scan environment/ for new files. Returns info for each new one."""
         current = self._scan_env_files()
         new_paths = current - self._seen_env_files
         self._seen_env_files = current
+        if not new_paths:
+            return []
         env_root = self.env_path
         results = []
         for rel_path in sorted(new_paths):
@@ -1036,12 +1325,23 @@ class Brain:
                 try:
                     import pymupdf
                     doc = pymupdf.open(fpath)
+                    # Only the first 4000 chars are kept — stop extracting once we have them
                     pages = []
-                    for page in doc:
-                        pages.append(page.get_text())
-                    doc.close()
-                    text = "\n\n".join(pages)
-                    entry["content"] = text[:4000] if text.strip() else "(PDF has no extractable text)"
+                    total = 0
+                    try:
+                        n_pages = min(doc.page_count, Brain._MAX_PDF_PAGES)
+                        if n_pages < doc.page_count:
+                            logger.info(f"Previewing first {n_pages} of {doc.page_count} pages of {rel_path}")
+                        for i in range(n_pages):
+                            page_text = doc.load_page(i).get_text("text")
+                            pages.append(page_text)
+                            total += len(page_text) + 2
+                            if total >= 4000:
+                                break
+                    finally:
+                        doc.close()
+                    text = "\n\n".join(pages)[:4000]
+                    entry["content"] = text if text.strip() else "(PDF has no extractable text)"
                 except ImportError:
                     entry["content"] = "(install pymupdf to read PDFs: pip install pymupdf)"
                 except Exception:
@@ -1049,8 +1349,7 @@ class Brain:
             elif ext in Brain._TEXT_EXTS:
                 try:
                     with open(fpath, "r", errors="replace") as f:
-                        text = f.read()
-                    entry["content"] = text[:2000]
+                        entry["content"] = f.read(2000)
                 except Exception:
                     entry["content"] = "(could not read file)"
             else:
@@ -1076,6 +1375,8 @@ class Brain:
             task = tool_args.get("task", "")
             detail = task[:60] + ("..." if len(task) > 60 else "")
             return {"type": "deep_exploration", "detail": f"Deep dive: {detail}"}
+        if tool_name == "rlm_status":
+            return {"type": "deep_exploration", "detail": "Checking on a deep dive..."}
         if tool_name == "ask_librarian":
             query = tool_args.get("query", "")
             detail = query[:60] + ("..." if len(query) > 60 else "")
@@ -1086,6 +1387,17 @@ class Brain:
             return {"type": "computing", "detail": f"Fold: {detail}"}
         return {"type": "working", "detail": tool_name}
 
+    @staticmethod
+    def _fold_run(tool_calls: list, start: int, limit: int) -> list[int]:
+        """Indices of the consecutive well-formed fold calls starting at `start` (at most `limit`)."""
+        run = []
+        for j in range(start, min(len(tool_calls), start + limit)):
+            tc = tool_calls[j]
+            if tc["name"].strip() != "fold" or "_raw" in tc["arguments"]:
+                break
+            run.append(j)
+        return run
+
     @staticmethod
     def _compact_tool_context(input_list: list) -> list:
         """Collapse older tool exchanges in input_list, keeping the last 3 turns.
@@ -1094,30 +1406,35 @@ class Brain:
         initial context (user nudge + first few items) and the most recent 3
         assistant+tool exchanges, replacing the middle with a brief summary.
         """
-        # Find indices of assistant messages (turn boundaries)
-        assistant_indices = []
+        # Short lists aren't worth summarizing — skip the scan entirely
+        if len(input_list) < 20:
+            return input_list
+
+        # Find assistant messages (turn boundaries): the first, and the last 3
+        first_assistant = -1
+        last_three = deque(maxlen=3)
+        n_assistant = 0
         for i, item in enumerate(input_list):
-            is_assistant = False
             if isinstance(item, dict):
-                if item.get("role") == "assistant":
-                    is_assistant = True
-            elif hasattr(item, "role") and getattr(item, "role", "") == "assistant":
-                is_assistant = True
-            elif isinstance(item, dict) and item.get("_local_type") == "assistant_with_tools":
-                is_assistant = True
-            if is_assistant:
-                assistant_indices.append(i)
+                role = item.get("role")
+            else:
+                role = getattr(item, "role", None)
+            if role == "assistant":
+                if first_assistant < 0:
+                    first_assistant = i
+                last_three.append(i)
+                n_assistant += 1
 
         # Not enough turns to compact
-        if len(assistant_indices) <= 3:
+        if n_assistant <= 3:
             return input_list
 
         # Keep everything before the 3rd-to-last assistant turn as "prefix"
         # Keep the last 3 turns as "suffix"
-        cut_point = assistant_indices[-3]
+        cut_point = last_three[0]
 
-        prefix = input_list[:assistant_indices[0]]  # initial context (user nudge etc.)
-        middle = input_list[assistant_indices[0]:cut_point]
+        prefix = input_list[:first_assistant]  # initial context (user nudge etc.)
+        middle = input_list[first_assistant:cut_point]
         suffix = input_list[cut_point:]
 
         # Summarize the middle section
@@ -1146,14 +1463,17 @@ class Brain:
     def _summarize_tool_loop(loop_log: list, seen_errors: dict) -> str:
         """Summarize a tool loop into a compact context entry."""
         successes = []
-        errors = []
+        n_errors = 0
+        unique_errors = []  # deduplicated, in order of first occurrence
+        seen_lines = set()
         for tool_name, args_brief, result_brief in loop_log:
-            is_err = (result_brief.startswith("Error:")
-                      or "not found" in result_brief.lower()
-                      or "not bound" in result_brief.lower())
+            is_err = _is_error_result(result_brief)
             line = f"  {tool_name}({args_brief[:50]}): {result_brief[:100]}"
             if is_err:
-                errors.append(line)
+                n_errors += 1
+                if line not in seen_lines:
+                    seen_lines.add(line)
+                    unique_errors.append(line)
             else:
                 successes.append(line)
 
@@ -1163,9 +1483,8 @@ class Brain:
             parts.extend(successes[:8])
             if len(successes) > 8:
                 parts.append(f"  ... and {len(successes) - 8} more")
-        if errors:
-            unique_errors = list(dict.fromkeys(errors))  # deduplicate, preserve order
-            parts.append(f"Errors ({len(errors)} total, {len(unique_errors)} unique):")
+        if n_errors:
+            parts.append(f"Errors ({n_errors} total, {len(unique_errors)} unique):")
             parts.extend(unique_errors[:5])
             if len(unique_errors) > 5:
                 parts.append(f"  ... and {len(unique_errors) - 5} more unique errors")
@@ -1182,16 +1501,13 @@ class Brain:
             self._mood_cycles = 0
             logger.info(f"Mood: {self._current_mood['label']}")
 
-    def _build_input(self) -> tuple[str, list[dict]]:
+    async def _build_input(self) -> tuple[str, list[dict]]:
         self._ensure_mood()
         instructions = main_system_prompt(self.identity, self._current_focus,
                                           mood=self._current_mood)
 
         input_list = []
-        recent = [e for e in self.events if e["type"] in ("thought", "tool_summary", "reflection")]
-        recent = recent[-config["max_thoughts_in_context"]:]
-
-        for ev in recent:
+        for ev in self._recent_context:
             if ev["type"] == "thought":
                 text = ev["text"]
                 if len(text) > 300:
@@ -1205,9 +1521,9 @@ class Brain:
             elif ev["type"] == "reflection":
                 input_list.append({"role": "assistant", "content": f"[Reflection: {ev['text'][:200]}...]"})
 
-        if self.thought_count == 0 and not recent:
+        if self.thought_count == 0 and not self._recent_context:
             # --- Wake up: read own files + retrieve memories ---
-            nudge = self._build_wake_nudge()
+            nudge = await self._build_wake_nudge()
         else:
             # --- Continue: include focus + relevant memories ---
             nudge = self._build_continue_nudge()
@@ -1255,12 +1571,12 @@ class Brain:
 
         return instructions, input_list
 
-    def _build_wake_nudge(self) -> str:
+    async def _build_wake_nudge(self) -> str:
         """Rich wake-up context — reads the creature's own files so it knows what it built."""
         parts = ["You're waking up. Here's your world:\n"]
 
         # Read projects.md
-        projects = self._read_file("projects.md")
+        projects = self._read_projects()[0]
         if projects:
             parts.append(f"**Your projects (projects.md):**\n{projects[:1500]}")
         else:
@@ -1275,11 +1591,11 @@ class Brain:
         # Retrieve memories
         memories = self.stream.retrieve("what was I working on and thinking about", top_k=5)
         if memories:
-            mem_text = "\n".join(f"- {m['content'][:200]}" for m in memories)
+            mem_text = _memory_bullets(memories)
             parts.append(f"**Memories from before:**\n{mem_text}")
 
         # Show recent Fold artifacts so creature knows what it computed before
-        artifacts = self._load_recent_artifacts(5)
+        artifacts = await self._load_recent_artifacts(5)
         if artifacts:
             art_lines = []
             for a in artifacts:
@@ -1307,20 +1623,19 @@ class Brain:
         if self._current_focus:
             parts.append(f"Current focus: {self._current_focus}")
 
+        # Background RLM runs that finished since the creature last checked
+        if self._rlm_results:
+            parts.append(f"Your RLM run(s) {', '.join(self._rlm_results)} finished — "
+                         "collect the results with rlm_status.")
+
         # Retrieve memories related to last thought
-        last_thought = next(
-            (e["text"] for e in reversed(self.events) if e["type"] == "thought"),
-            None,
-        )
+        last_thought = self._last_thought
         if last_thought:
-            memories = self.stream.retrieve(last_thought, top_k=3)
+            # Skip anything from the last 30s — that's the thought we just had
+            memories = self.stream.retrieve(last_thought, top_k=3, older_than_seconds=30)
             if memories:
-                now = datetime.now()
-                older = [m for m in memories
-                         if (now - datetime.fromisoformat(m["timestamp"])).total_seconds() > 30]
-                if older:
-                    mem_text = "\n".join(f"- {m['content'][:200]}" for m in older)
-                    parts.append(f"Related memories:\n{mem_text}")
+                mem_text = _memory_bullets(memories)
+                parts.append(f"Related memories:\n{mem_text}")
 
         if parts:
             return "Continue.\n" + "\n".join(parts)
@@ -1333,7 +1648,7 @@ class Brain:
         self.state = "thinking"
         await self._broadcast({"event": "status", "data": {"state": "thinking", "thought_count": self.thought_count}})
 
-        instructions, input_list = self._build_input()
+        instructions, input_list = await self._build_input()
 
         try:
             response = await asyncio.to_thread(
@@ -1350,6 +1665,9 @@ class Brain:
         tool_call_count = 0
         loop_log = []       # (tool_name, args_brief, result_brief) for summary
         seen_errors = {}    # error_string -> count, for dedup
+        # Bound once — looked up per tool call below
+        make_tool_result = self.provider.make_tool_result
+        max_tool_calls = Brain.MAX_TOOL_CALLS
 
         while response["tool_calls"]:
             if response.get("text"):
@@ -1357,26 +1675,42 @@ class Brain:
 
             input_list += response["output"]
 
-            for tc in response["tool_calls"]:
+            tool_calls = response["tool_calls"]
+            # Valid JSON that isn't an object takes the malformed-call path, so
+            # every handler (and the fold look-ahead) can rely on a dict
+            for tc in tool_calls:
+                if not isinstance(tc["arguments"], dict):
+                    tc["arguments"] = {
+                        "_raw": str(tc["arguments"])[:300],
+                        "_error": "arguments must be a JSON object",
+                    }
+            fold_batch: dict[int, str] = {}  # index -> result, for pipelined fold runs
+            announced: set[int] = set()      # fold calls whose tool_call went out with their batch
+
+            for i, tc in enumerate(tool_calls):
                 tool_name = tc["name"].strip()
                 tool_args = tc["arguments"]
                 call_id = tc["call_id"]
+                expr = ""  # fold's argument — read in the fold branch, reused below
 
                 # Cap check BEFORE execution — skip this call and all remaining
                 # but still provide results so the protocol stays valid
-                if tool_call_count >= Brain.MAX_TOOL_CALLS:
-                    result = f"(Skipped — tool loop cap of {Brain.MAX_TOOL_CALLS} reached)"
+                if tool_call_count >= max_tool_calls:
+                    result = f"(Skipped — tool loop cap of {max_tool_calls} reached)"
                     result_for_input = result
                     loop_log.append((tool_name, "", result[:150]))
-                    input_list.append(self.provider.make_tool_result(call_id, result_for_input))
+                    input_list.append(make_tool_result(call_id, result_for_input))
                     continue
 
                 tool_call_count += 1
-                await self._emit("tool_call", tool=tool_name, args=tool_args)
-
-                # Broadcast activity for frontend visualization
-                activity = self._classify_activity(tool_name, tool_args)
-                await self._broadcast({"event": "activity", "data": activity})
+                if i not in announced:
+                    # Log the call and broadcast activity for frontend visualization
+                    # in one await (both just fan out to the websockets)
+                    activity = self._classify_activity(tool_name, tool_args)
+                    await asyncio.gather(
+                        self._emit("tool_call", tool=tool_name, args=tool_args),
+                        self._broadcast({"event": "activity", "data": activity}),
+                    )
 
                 try:
                     # Skip malformed tool calls gracefully — show what went wrong
@@ -1388,27 +1722,33 @@ class Brain:
                             f"Raw arguments: {raw_preview}\n"
                             f"Fix the JSON and try again."
                         )
-                    elif tool_name == "move":
-                        result = await self._handle_move(tool_args)
-                    elif tool_name == "respond":
-                        result = await self._handle_respond(tool_args)
-                    elif tool_name == "bbs":
-                        result = await self._handle_bbs(tool_args)
-                    elif tool_name == "restart_fold":
-                        result = await self._handle_restart_fold()
-                    elif tool_name == "rlm":
-                        result = await self._handle_rlm(tool_args)
-                    elif tool_name == "ask_librarian":
-                        result = await self._handle_ask_librarian(tool_args)
                     elif tool_name == "fold":
-                        session = f"myxo-{self.identity['name'].lower()}"
-                        result = await asyncio.to_thread(
-                            fold_evaluate, tool_args.get("expression", ""), session
-                        )
+                        expr = tool_args.get("expression", "")
+                        session = self._session
+                        if i not in fold_batch:
+                            # Pipeline this call together with the fold calls right after it
+                            run = self._fold_run(tool_calls, i, max_tool_calls - tool_call_count + 1)
+                            # Announce the rest of the batch before it runs, not after
+                            await asyncio.gather(*(
+                                coro
+                                for j in run[1:] if j not in announced
+                                for coro in (
+                                    self._emit("tool_call", tool="fold", args=tool_calls[j]["arguments"]),
+                                    self._broadcast({
+                                        "event": "activity",
+                                        "data": self._classify_activity("fold", tool_calls[j]["arguments"]),
+                                    }),
+                                )
+                            ))
+                            announced.update(run)
+                            exprs = [tool_calls[j]["arguments"].get("expression", "") for j in run]
+                            results = await asyncio.to_thread(fold_evaluate_many, exprs, session)
+                            fold_batch = dict(zip(run, results))
+                        result = fold_batch.pop(i)
                         # Circuit breaker: consecutive eval timeouts → kill daemon
                         # Only count evaluation timeouts (worker hung), not connection
                         # timeouts (transient infra issue).
-                        if "eval timed out" in result or "eval RLM run timed out" in result:
+                        if _FOLD_EVAL_TIMEOUT_RE.search(result):
                             self._fold_consecutive_timeouts += 1
                             if self._fold_consecutive_timeouts >= Brain.FOLD_TIMEOUT_THRESHOLD:
                                 logger.warning(
@@ -1428,6 +1768,8 @@ class Brain:
                             # Connection failures are transient — don't count
                             # toward circuit breaker, but log for visibility
                             logger.info("Fold connect timeout (transient, not counting toward breaker)")
+                        elif result.startswith("Error: outcome unknown"):
+                            pass  # reply lost after an earlier batch failure — neither success nor timeout
                         else:
                             self._fold_consecutive_timeouts = 0
                         # Detect daemon restart (session state wiped)
@@ -1440,11 +1782,13 @@ class Brain:
                             self._fold_session_warned = True
                         # Record non-error results as artifacts
                         if not result.startswith("Error:"):
-                            self._record_fold_artifact(
-                                tool_args.get("expression", ""), result
-                            )
+                            self._record_fold_artifact(expr, result)
                     else:
-                        result = f"Unknown tool: {tool_name}"
+                        handler = self._tool_handlers.get(tool_name)
+                        if handler is None:
+                            result = f"Unknown tool: {tool_name}"
+                        else:
+                            result = await handler(tool_args)
                 except Exception as e:
                     result = f"Error: {e}"
 
@@ -1464,23 +1808,20 @@ class Brain:
                         "or (lf \"keyword\") to search by name."
                     )
 
+                # Classified once — the notes appended below never change it
+                is_error = _is_error_result(result)
+
                 # Cross-cycle fixation detection
                 if tool_name == "fold":
-                    expr_key = tool_args.get("expression", "").strip()
-                    is_error = (
-                        result.startswith("Error:")
-                        or "not found" in result.lower()
-                        or "not bound" in result.lower()
-                    )
+                    expr_key = expr.strip()
                     if is_error:
-                        self._persistent_errors[expr_key] = self._persistent_errors.get(expr_key, 0) + 1
-                        count = self._persistent_errors[expr_key]
-                        # Prune old entries to prevent unbounded growth
-                        if len(self._persistent_errors) > 50:
-                            self._persistent_errors = dict(
-                                sorted(self._persistent_errors.items(),
-                                       key=lambda x: x[1], reverse=True)[:25]
-                            )
+                        persistent = self._persistent_errors
+                        count = persistent.get(expr_key, 0) + 1
+                        persistent[expr_key] = count
+                        # Keep the 50 most recently failing expressions
+                        persistent.move_to_end(expr_key)
+                        if len(persistent) > 50:
+                            persistent.popitem(last=False)
                         if count >= 2:
                             result += (
                                 f"\n\nWARNING: You've tried this exact expression {count} times "
@@ -1491,9 +1832,6 @@ class Brain:
                         self._persistent_errors.pop(expr_key, None)
 
                 result_for_input = result
-                is_error = (result.startswith("Error:")
-                            or "not found" in result.lower()
-                            or "not bound" in result.lower())
                 if is_error:
                     error_key = result.strip()
                     seen_errors[error_key] = seen_errors.get(error_key, 0) + 1
@@ -1503,15 +1841,17 @@ class Brain:
                 # Collect for post-loop summary
                 args_brief = ""
                 if tool_name == "fold":
-                    args_brief = tool_args.get("expression", "")[:80]
+                    args_brief = expr[:80]
                 elif tool_name == "move":
                     args_brief = tool_args.get("location", "")
                 loop_log.append((tool_name, args_brief, result[:150]))
 
-                await self._broadcast({"event": "activity", "data": {"type": "idle", "detail": ""}})
-                await self._emit("tool_result", tool=tool_name, output=result)
+                await asyncio.gather(
+                    self._broadcast({"event": "activity", "data": {"type": "idle", "detail": ""}}),
+                    self._emit("tool_result", tool=tool_name, output=result),
+                )
 
-                input_list.append(self.provider.make_tool_result(call_id, result_for_input))
+                input_list.append(make_tool_result(call_id, result_for_input))
 
             # Mid-loop context compaction: every 6 tool calls, collapse older
             # tool exchanges into a summary to prevent unbounded growth.
@@ -1519,7 +1859,7 @@ class Brain:
                 input_list = self._compact_tool_context(input_list)
 
             # Circuit breaker: cap tool calls per think cycle
-            if tool_call_count >= Brain.MAX_TOOL_CALLS:
+            if tool_call_count >= max_tool_calls:
                 logger.info(f"Tool loop hit cap ({tool_call_count} calls), forcing summary")
                 input_list.append({
                     "role": "user",
@@ -1567,7 +1907,7 @@ class Brain:
             summary = self._summarize_tool_loop(loop_log, seen_errors)
             await self._emit("tool_summary", text=summary)
 
-        # Accumulate journal tag for this cycle (cap at 20 to prevent unbounded growth)
+        # Accumulate journal tag for this cycle (the deque keeps the last 20)
         thought_text = response.get("text", "") or ""
         mood_label = self._current_mood["label"] if self._current_mood else "unknown"
         self._journal_tags.append({
@@ -1577,8 +1917,6 @@ class Brain:
             "tool_count": tool_call_count,
             "was_active": was_active,
         })
-        if len(self._journal_tags) > 20:
-            self._journal_tags = self._journal_tags[-20:]
 
         return was_active
 
@@ -1616,7 +1954,12 @@ class Brain:
 
         # Store each insight as a reflection memory
         source_ids = [m["id"] for m in recent_memories]
-        insights = [line.strip() for line in reflection_text.split("\n") if line.strip()]
+        insights = [s for line in reflection_text.split("\n") if (s := line.strip())]
+        # Each insight costs an embedding and an importance call — keep the first few
+        if len(insights) > Brain.MAX_REFLECTION_INSIGHTS:
+            logger.info(f"Reflection produced {len(insights)} insights, storing the first "
+                        f"{Brain.MAX_REFLECTION_INSIGHTS}")
+            insights = insights[:Brain.MAX_REFLECTION_INSIGHTS]
 
         for insight in insights:
             try:
@@ -1637,8 +1980,11 @@ class Brain:
         await self._broadcast({"event": "status", "data": {"state": "planning", "thought_count": self.thought_count}})
 
         # Gather current state for the planner
-        projects = self._read_file("projects.md") or "(no projects.md yet)"
-        files = self._list_env_files()
+        # projects.md comes from the mtime cache; only the first 30 file names
+        # are shown, so pick them without sorting the whole tree
+        projects = (self._read_projects()[0] or "(no projects.md yet)")[:2000]
+        files = heapq.nsmallest(30, self._scan_env_files())
+        files_text = "\n".join(files) if files else "(empty)"
         recent_memories = self.stream.get_recent(n=10)
         memories_text = "\n".join(
             f"- {m['content'][:200]}" for m in recent_memories
@@ -1647,10 +1993,10 @@ class Brain:
         plan_input = [{"role": "user", "content": f"""Time to plan. Here's your current state:
 
 ## Current projects.md:
-{projects[:2000]}
+{projects}
 
 ## Files in your world:
-{chr(10).join(files[:30]) if files else '(empty)'}
+{files_text}
 
 ## Recent thoughts:
 {memories_text}"""}]
@@ -1678,25 +2024,18 @@ class Brain:
             plan_body = plan_text[:idx].strip()
             log_entry = plan_text[idx + len(log_sep):].strip()
 
-        # Write projects.md
-        env_root = self.env_path
-        try:
-            with open(os.path.join(env_root, "projects.md"), "w") as f:
-                f.write(plan_body)
-        except Exception as e:
-            logger.error(f"Failed to write projects.md: {e}")
-
-        # Append daily log entry
+        # Write projects.md and the daily log entry in one worker-thread hop
+        log_path = log_text = None
         if log_entry:
-            log_dir = os.path.join(env_root, "logs")
-            os.makedirs(log_dir, exist_ok=True)
-            log_path = os.path.join(log_dir, f"{date.today().isoformat()}.md")
-            try:
-                now_str = datetime.now().strftime("%I:%M %p")
-                with open(log_path, "a") as f:
-                    f.write(f"\n## {now_str}\n{log_entry}\n")
-            except Exception as e:
-                logger.error(f"Failed to write daily log: {e}")
+            now = datetime.now()
+            log_path = os.path.join(self.env_path, "logs", f"{now.date().isoformat()}.md")
+            log_text = f"\n## {now.strftime('%I:%M %p')}\n{log_entry}\n"
+        await asyncio.to_thread(self._write_plan_outputs, plan_body, log_path, log_text)
+        # A same-size rewrite within the filesystem's mtime granularity would
+        # keep the old (mtime_ns, size) key, so drop the cached copy here. The
+        # creature edits projects.md with its own tools too; those writes
+        # still rely on the key.
+        self._projects_cache = None
 
         # Update current focus for sticky behavior
         self._current_focus = self._load_current_focus()
@@ -1765,17 +2104,25 @@ class Brain:
             pace = active_pace if was_active else idle_pace
             self._wake_event.clear()
             try:
-                await asyncio.wait_for(self._wake_event.wait(), timeout=pace)
-            except asyncio.TimeoutError:
+                async with asyncio.timeout(pace):
+                    await self._wake_event.wait()
+            except TimeoutError:
                 pass
 
     def _log_jsonl(self, entry: dict):
-        """Write an arbitrary entry to the JSONL log file."""
+        """Write an arbitrary entry to the JSONL log file.
+
+        Goes through the API-call log's writer, so it shares that file handle
+        and batching. Outside a running event loop it falls back to a direct append.
+        """
         try:
-            with open(LOG_PATH, "a") as f:
-                f.write(json.dumps(entry) + "\n")
-        except Exception:
-            pass
+            self._api_log_writer.write(entry)
+        except RuntimeError:
+            try:
+                with open(LOG_PATH, "ab") as f:
+                    f.write(_jsonl_line(entry))
+            except Exception:
+                pass
 
     def stop(self):
         self.running = False
@@ -1784,3 +2131,17 @@ class Brain:
             self.stop_session_log()
         if hasattr(self, "_wake_event"):
             self._wake_event.set()
+
+    async def aclose(self):
+        """Stop background RLM runs, then flush the queued log entries and close the memory stream."""
+        for t in self._rlm_tasks.values():
+            t.cancel()  # no-op for finished runs
+        await asyncio.gather(*self._rlm_tasks.values(), return_exceptions=True)
+        for run in self._rlm_runs:
+            if run["id"] in self._rlm_tasks and run["status"] == "running":
+                run["status"] = "cancelled"
+                run["output"] = "Cancelled at shutdown"
+        await self._artifact_writer.aclose()
+        await self._api_log_writer.aclose()
+        if self.stream is not None:
+            self.stream.close()
@@ -1,10 +1,19 @@
 """All configuration in one place."""
 
+import json
 import os
 import yaml
 
+# libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), "..", "config.yaml")
 ENV_PATH = os.path.join(os.path.dirname(__file__), "..", ".env")
+# Parsed config.yaml, reused while config.yaml is unchanged (JSON parses much faster)
+CACHE_PATH = os.path.join(os.path.dirname(__file__), "..", ".config.yaml.cache.json")
 
 # Load .env if it exists (no dependency needed)
 if os.path.isfile(ENV_PATH):
@@ -16,10 +25,37 @@ if os.path.isfile(ENV_PATH):
                 os.environ.setdefault(_k.strip(), _v.strip())
 
 
+def _read_config_file() -> dict:
+    """Parse config.yaml, going through the JSON cache when it's current."""
+    st = os.stat(CONFIG_PATH)
+    stamp = [st.st_mtime_ns, st.st_size]
+    try:
+        with open(CACHE_PATH, "r") as f:
+            cached = json.load(f)
+        if cached.get("stamp") == stamp:
+            return cached["data"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    with open(CONFIG_PATH, "r") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    # Only cache what survives a JSON round trip unchanged (no dates, int keys...)
+    try:
+        blob = json.dumps({"stamp": stamp, "data": data})
+        if json.loads(blob)["data"] == data:
+            tmp = CACHE_PATH + ".tmp"
+            with open(tmp, "w") as f:
+                f.write(blob)
+            os.replace(tmp, CACHE_PATH)
+    except (OSError, TypeError, ValueError):
+        pass
+    return data
+
+
 def load_config() -> dict:
     """Load config from config.yaml, with env var overrides."""
-    with open(CONFIG_PATH, "r") as f:
-        config = yaml.safe_load(f)
+    config = _read_config_file()
 
     # Environment variable overrides
     config["api_key"] = (
@@ -1,10 +1,13 @@
 """Thin client for The Fold daemon — talks via Unix domain socket."""
 
+import atexit
+import itertools
 import os
 import re
 import socket
 import struct
-import uuid
+import threading
+import time
 import subprocess
 import logging
 
@@ -14,6 +17,25 @@ logger = logging.getLogger("myxo.fold")
 FOLD_ROOT = os.path.expanduser("~/fold")
 REPL_DIR = os.path.join(FOLD_ROOT, ".fold-repl")
 
+# Response field patterns — compiled once, used on every Fold reply
+_TYPE_RE = re.compile(r'\(type\s+\.\s+(\w+)\)')
+_VALUE_RE = re.compile(r'\(value\s+\.\s+"((?:[^"\\]|\\.)*)"\)')
+_ERR_RE = re.compile(r'\(message\s+\.\s+"((?:[^"\\]|\\.)*)"\)')
+_UNESCAPE_RE = re.compile(r'\\([\\"])')
+# A string body up to its closing quote: runs of plain bytes and \-escapes
+_STRING_BODY_RE = re.compile(rb'[^"\\]*+(?:\\.[^"\\]*+)*+', re.DOTALL)
+_UTF8_CONT = bytes(range(0x80, 0xC0))  # continuation bytes — every other byte starts a character
+
+# Byte classes for the hand scanner, which reads the raw reply payload
+_REPLY_KEYS = (b"type", b"value", b"message")
+_DELIMS = frozenset(b' \t\r\n()."')
+_SPACE = frozenset(b" \t\r\n\f\v")
+_WORD = frozenset(b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
+_QUOTE, _LPAREN, _RPAREN, _DOT, _BACKSLASH = b'"().\\'
+
+# Scheme string escaping for request expressions — one pass via str.translate
+_ESC_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"'})
+
 
 def _get_socket_path() -> str | None:
     """Find the daemon's socket path from its ready file."""
@@ -35,10 +57,29 @@ def _get_socket_path() -> str | None:
     return None
 
 
+# The socket path and daemon.pid mtime are re-read from disk at most every
+# _DAEMON_STATE_TTL seconds. A new connection (the daemon may have restarted)
+# or a failed one refreshes them sooner. Each entry is [value, checked_at].
+_DAEMON_STATE_TTL = 2.0
+_sock_path_cache: list = [None, 0.0]
+_pid_mtime_cache: list = [0.0, float("-inf")]
+
+
+def _forget_daemon_state():
+    """Drop the cached socket path and pid mtime — re-read both on next use."""
+    _sock_path_cache[0] = None
+    _pid_mtime_cache[1] = float("-inf")
+
+
 def _ensure_daemon() -> str | None:
     """Start the daemon if not running. Returns socket path or None."""
+    sock_path, checked_at = _sock_path_cache
+    now = time.monotonic()
+    if sock_path and now - checked_at < _DAEMON_STATE_TTL:
+        return sock_path
     sock_path = _get_socket_path()
     if sock_path:
+        _sock_path_cache[:] = [sock_path, now]
         return sock_path
 
     logger.info("Fold daemon not running, starting...")
@@ -55,13 +96,10 @@ def _ensure_daemon() -> str | None:
             stderr=subprocess.DEVNULL,
         )
         # Wait for daemon to be ready (up to 10s)
-        import time
-        for _ in range(20):
-            time.sleep(0.5)
-            sock_path = _get_socket_path()
-            if sock_path:
-                logger.info("Fold daemon started.")
-                return sock_path
+        sock_path = _wait_for_socket(10.0)
+        if sock_path:
+            logger.info("Fold daemon started.")
+            return sock_path
         logger.error("Fold daemon failed to start in time.")
     except Exception as e:
         logger.error(f"Failed to start daemon: {e}")
@@ -69,32 +107,198 @@ def _ensure_daemon() -> str | None:
     return None
 
 
-def _recv_exact(s: socket.socket, n: int) -> bytes:
-    """Receive exactly n bytes."""
-    buf = b""
-    while len(buf) < n:
-        chunk = s.recv(n - len(buf))
-        if not chunk:
+def _wait_for_socket(timeout: float) -> str | None:
+    """Block until the ready file points at a live socket, or the timeout passes.
+
+    Wakes on inotify events in REPL_DIR when inotify_simple is installed
+    (Linux); otherwise polls the ready file at a short interval.
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        from inotify_simple import INotify, flags
+        os.makedirs(REPL_DIR, exist_ok=True)
+        with INotify() as ino:
+            ino.add_watch(REPL_DIR, flags.CREATE | flags.MODIFY | flags.MOVED_TO)
+            while True:
+                sock_path = _get_socket_path()
+                if sock_path:
+                    return sock_path
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                # Re-check at least every 0.5s — the socket itself may live outside REPL_DIR
+                ino.read(timeout=int(min(remaining, 0.5) * 1000))
+    except (ImportError, OSError):
+        pass
+
+    while time.monotonic() < deadline:
+        sock_path = _get_socket_path()
+        if sock_path:
+            return sock_path
+        time.sleep(0.05)
+    return _get_socket_path()
+
+
+def _recv_exact(s: socket.socket, n: int) -> bytearray:
+    """Receive exactly n bytes into a preallocated buffer."""
+    buf = bytearray(n)
+    view = memoryview(buf)
+    off = 0
+    while off < n:
+        got = s.recv_into(view[off:], n - off)
+        if not got:
             raise ConnectionError("Socket closed during read")
-        buf += chunk
+        off += got
     return buf
 
 
-def _parse_response(resp_str: str) -> dict:
-    """Parse s-expression response into a result dict."""
-    type_match = re.search(r'\(type\s+\.\s+(\w+)\)', resp_str)
-    msg_type = type_match.group(1) if type_match else "unknown"
+def _unescape(s: str) -> str:
+    """Undo Scheme string escaping of backslash and double quote, left to right."""
+    if "\\" not in s:
+        return s
+    return _UNESCAPE_RE.sub(r"\1", s)
+
+
+def _decode_head(buf: bytearray, view: memoryview, start: int, end: int,
+                 escaped: bool, max_chars: int) -> tuple[str, int]:
+    """(first max_chars characters, full length) of the string body buf[start:end].
+
+    The length is counted on the bytes, so only the head is ever decoded.
+    Every \\\\ pair and every quote in a body is one escape that unescaping
+    removes a byte for; UTF-8 continuation bytes don't start a character.
+    """
+    length = end - start
+    if escaped:
+        length -= buf.count(b"\\\\", start, end) + buf.count(b'"', start, end)
+    if not buf.isascii():
+        length -= (end - start) - len(bytes(view[start:end]).translate(None, _UTF8_CONT))
+    # Each character takes at most 4 bytes; back off to a character start
+    k = min(end, start + 4 * max_chars + 8)
+    while k < end and buf[k] & 0xC0 == 0x80:
+        k -= 1
+    text = str(view[start:k], "utf-8")
+    return (_unescape(text) if escaped else text)[:max_chars], length
+
+
+def _scan_string(buf: bytearray, i: int, view: memoryview | None = None,
+                 max_chars: int | None = None) -> tuple[str | None, int, int]:
+    """Read the quoted string opening at buf[i]; return (text, index past the close, length).
+
+    Only the string's own bytes are decoded, straight out of view, then run
+    through _unescape. Without a view the string is just skipped (text is None).
+    With max_chars, text stops after that many characters; length is still
+    the whole string's.
+    """
+    start = i + 1
+    q = buf.find(b'"', start)
+    if q > start and buf[q - 1] == _BACKSLASH:
+        # That quote may be escaped — let the regex step over the escapes
+        q = _STRING_BODY_RE.match(buf, start).end()
+    if q < 0 or q >= len(buf) or buf[q] != _QUOTE:
+        raise ValueError("unterminated string")
+    if view is None:
+        return None, q + 1, 0
+    escaped = buf.find(b"\\", start, q) >= 0
+    # A string can't have more characters than bytes — only long ones need cutting
+    if max_chars is not None and q - start > max_chars:
+        text, length = _decode_head(buf, view, start, q, escaped, max_chars)
+        return text, q + 1, length
+    text = str(view[start:q], "utf-8")
+    if escaped:
+        text = _unescape(text)
+    return text, q + 1, len(text)
+
+
+def _parse_sexp_reply(buf: bytearray, max_chars: int | None = None) -> dict | None:
+    """Pull type/value/message out of a raw daemon reply in one left-to-right scan.
+
+    Works on the undecoded payload, so the reply is never held as bytes and a
+    full decoded copy at once. A value longer than max_chars is only decoded
+    up to that point; its full length goes in "value_len". Returns None when
+    it isn't the expected shape.
+    """
+    view = memoryview(buf)
+    fields = {}
+    n = len(buf)
+    i = 0
+    while i < n:
+        c = buf[i]
+        if c == _QUOTE:
+            _, i, _ = _scan_string(buf, i)
+            continue
+        i += 1
+        if c != _LPAREN:
+            continue
+        j = i
+        while j < n and buf[j] not in _DELIMS:
+            j += 1
+        key = bytes(buf[i:j])
+        if key not in _REPLY_KEYS:
+            continue
+        key = key.decode()
+        if key in fields:
+            continue
+        while j < n and buf[j] in _SPACE:
+            j += 1
+        if j >= n or buf[j] != _DOT:
+            continue
+        j += 1
+        while j < n and buf[j] in _SPACE:
+            j += 1
+        if key == "type":
+            k = j
+            while k < n and buf[k] in _WORD:
+                k += 1
+            if k > j and k < n and buf[k] == _RPAREN:
+                fields[key] = buf[j:k].decode()
+            i = k
+        elif j < n and buf[j] == _QUOTE:
+            text, i, length = _scan_string(buf, j, view, max_chars if key == "value" else None)
+            if i < n and buf[i] == _RPAREN:
+                fields[key] = text
+                if key == "value":
+                    fields["value_len"] = length
+        else:
+            i = j
+    return fields if "type" in fields else None
+
+
+def _parse_response_regex(resp_str: str) -> dict:
+    """Regex fallback for replies the scanner doesn't recognise."""
+    fields = {}
+    type_match = _TYPE_RE.search(resp_str)
+    if type_match:
+        fields["type"] = type_match.group(1)
+    value_match = _VALUE_RE.search(resp_str)
+    if value_match:
+        fields["value"] = _unescape(value_match.group(1))
+    err_match = _ERR_RE.search(resp_str)
+    if err_match:
+        fields["message"] = _unescape(err_match.group(1))
+    return fields
+
+
+def _parse_response(payload: bytes | bytearray, max_chars: int | None = None) -> dict:
+    """Parse a raw s-expression reply payload into a result dict.
+
+    "length" is the full result's length even when max_chars cut "result" short.
+    """
+    try:
+        fields = _parse_sexp_reply(payload, max_chars)
+    except (ValueError, IndexError):
+        fields = None
+    if fields is None:
+        fields = _parse_response_regex(payload.decode("utf-8"))
+    msg_type = fields.get("type", "unknown")
 
     if msg_type == "result":
-        value_match = re.search(r'\(value\s+\.\s+"((?:[^"\\]|\\.)*)"\)', resp_str)
-        value = value_match.group(1).replace('\\"', '"').replace('\\\\', '\\') if value_match else ""
-        return {"status": "success", "result": value}
+        value = fields.get("value", "")
+        return {"status": "success", "result": value, "length": fields.get("value_len", len(value))}
     elif msg_type == "error":
-        err_match = re.search(r'\(message\s+\.\s+"((?:[^"\\]|\\.)*)"\)', resp_str)
-        error_msg = err_match.group(1).replace('\\"', '"').replace('\\\\', '\\') if err_match else "unknown error"
-        return {"status": "error", "error": error_msg}
+        return {"status": "error", "error": fields.get("message", "unknown error")}
     else:
-        return {"status": "error", "error": f"Unexpected response: {resp_str[:200]}"}
+        head = payload[:800].decode("utf-8", "ignore")
+        return {"status": "error", "error": f"Unexpected response: {head[:200]}"}
 
 
 MAX_RESULT_LENGTH = 2000  # Truncate results longer than this to avoid context blowup
@@ -102,15 +306,24 @@ MAX_RESULT_LENGTH_LONG = 8000  # For long-running evaluations (RLM runs)
 
 # Track daemon generation per-session to detect restarts
 _daemon_generation: dict[str, float] = {}  # session_id -> daemon pid file mtime
+# Sessions whose latest eval succeeded and stamped _daemon_generation with the
+# current mtime — check_session_fresh() answers those without another stat.
+_generation_synced: set[str] = set()
 
 
 def _daemon_pid_mtime() -> float:
     """Get mtime of daemon PID file — changes on daemon restart."""
+    mtime, checked_at = _pid_mtime_cache
+    now = time.monotonic()
+    if now - checked_at < _DAEMON_STATE_TTL:
+        return mtime
     pid_file = os.path.join(REPL_DIR, "daemon.pid")
     try:
-        return os.path.getmtime(pid_file)
+        mtime = os.path.getmtime(pid_file)
     except OSError:
-        return 0.0
+        mtime = 0.0
+    _pid_mtime_cache[:] = [mtime, now]
+    return mtime
 
 
 def check_session_fresh(session_id: str) -> bool:
@@ -119,6 +332,8 @@ def check_session_fresh(session_id: str) -> bool:
     Call after evaluate() — if True, the session's Fold environment was reset
     (all definitions, loaded modules, and variables are gone).
     """
+    if session_id in _generation_synced:
+        return False
     current = _daemon_pid_mtime()
     prev = _daemon_generation.get(session_id, current)
     return current != prev
@@ -138,6 +353,8 @@ def kill_daemon() -> bool:
         logger.warning(f"Circuit breaker: killed Fold daemon (PID {pid})")
         # Clear cached generation so check_session_fresh() detects the restart
         _daemon_generation.clear()
+        _generation_synced.clear()
+        _forget_daemon_state()
         return True
     except (FileNotFoundError, ValueError, ProcessLookupError, PermissionError):
         return False
@@ -145,6 +362,106 @@ def kill_daemon() -> bool:
 
 CONNECT_TIMEOUT = 5.0  # seconds — connection to daemon should be near-instant
 
+# Persistent connections — one per session, reused across evaluations instead
+# of a connect/close per call. The per-session lock keeps request/reply pairs
+# on a shared socket from interleaving.
+_conns: dict[str, socket.socket] = {}
+_conn_locks: dict[str, threading.Lock] = {}
+_conns_guard = threading.Lock()
+
+
+def _session_lock(session_id: str) -> threading.Lock:
+    with _conns_guard:
+        lock = _conn_locks.get(session_id)
+        if lock is None:
+            lock = _conn_locks[session_id] = threading.Lock()
+        return lock
+
+
+def _get_conn(session_id: str, sock_path: str) -> tuple[socket.socket, bool]:
+    """Return (socket, reused) — the session's cached connection, or a fresh one."""
+    s = _conns.get(session_id)
+    if s is not None:
+        return s, True
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    s.settimeout(CONNECT_TIMEOUT)
+    try:
+        s.connect(sock_path)
+    except BaseException:
+        s.close()
+        _forget_daemon_state()
+        raise
+    # A new connection may be to a restarted daemon — re-stat daemon.pid
+    _pid_mtime_cache[1] = float("-inf")
+    _conns[session_id] = s
+    return s, False
+
+
+def _drop_conn(session_id: str):
+    """Close and forget a session's cached connection."""
+    s = _conns.pop(session_id, None)
+    if s is not None:
+        try:
+            s.close()
+        except OSError:
+            pass
+
+
+@atexit.register
+def _close_all_conns():
+    for session_id in list(_conns):
+        _drop_conn(session_id)
+
+
+# Request ids only need to be unique per connection; the pid in the high
+# bits keeps them distinct across creatures sharing one daemon.
+_REQ_IDS = itertools.count((os.getpid() & 0xFFFF) << 16)
+
+
+def _encode_request(expression: str, session_id: str) -> list[bytes]:
+    """Build one length-prefixed request frame as [header, body] buffers."""
+    req_id = f"{next(_REQ_IDS) & 0xFFFFFFFF:08x}"
+    escaped = expression.translate(_ESC_TABLE)
+    msg = f'((type . request) (id . "{req_id}") (session . "{session_id}") (expr . "{escaped}"))'
+    data = msg.encode("utf-8")
+    return [struct.pack(">I", len(data)), data]
+
+
+def _send_buffers(s: socket.socket, buffers: list[bytes]):
+    """Write buffers back to back with vectored sends — no joined copy."""
+    if not hasattr(s, "sendmsg"):
+        s.sendall(b"".join(buffers))
+        return
+    views = [memoryview(b) for b in buffers]
+    while views:
+        sent = s.sendmsg(views)
+        # Drop what went out; a short write leaves a partial buffer at the front
+        while views and sent >= len(views[0]):
+            sent -= len(views[0])
+            views.pop(0)
+        if sent:
+            views[0] = views[0][sent:]
+
+
+def _decode_reply(payload: bytearray, session_id: str, max_result_length: int) -> str:
+    """Turn a reply payload into the result string handed back to callers."""
+    try:
+        resp = _parse_response(payload, max_result_length)
+    except Exception as e:
+        return f"Error: {e}"
+
+    if resp["status"] == "success":
+        _daemon_generation[session_id] = _daemon_pid_mtime()
+        _generation_synced.add(session_id)
+
+        result = resp.get("result", "(no result)")
+        length = resp.get("length", len(result))
+        if length > max_result_length:
+            result = result[:max_result_length] + f"\n(truncated — {length} chars total)"
+        return result
+    else:
+        return f"Error: {resp.get('error', 'unknown')}"
+
 
 def _evaluate_impl(expression: str, session_id: str, timeout: float,
                     max_result_length: int, max_response_bytes: int,
@@ -154,50 +471,49 @@ def _evaluate_impl(expression: str, session_id: str, timeout: float,
     if not sock_path:
         return "Error: Fold daemon is not running and could not be started."
 
-    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    try:
-        # Phase 1: Connect — short timeout, failure here is transient/infra
-        s.settimeout(CONNECT_TIMEOUT)
+    frame = _encode_request(expression, session_id)
+    _generation_synced.discard(session_id)
+
+    with _session_lock(session_id):
         try:
-            s.connect(sock_path)
+            for _attempt in range(2):
+                # Phase 1: Connect (or reuse) — short timeout, failure here is transient/infra
+                try:
+                    s, reused = _get_conn(session_id, sock_path)
+                except socket.timeout:
+                    return "Error: connect timed out (daemon may be overloaded)"
+                except ConnectionRefusedError:
+                    return "Error: Fold daemon refused connection."
+
+                # Phase 2: Evaluation — use the caller's timeout for actual computation
+                s.settimeout(timeout)
+                try:
+                    _send_buffers(s, frame)
+                    length_bytes = _recv_exact(s, 4)
+                    break
+                except socket.timeout:
+                    raise
+                except OSError:
+                    # A cached connection can go stale (daemon restarted or
+                    # closed it) — reconnect once before giving up
+                    _drop_conn(session_id)
+                    if not reused:
+                        raise
+
+            length = struct.unpack(">I", length_bytes)[0]
+            if length > max_response_bytes:
+                _drop_conn(session_id)  # unread payload left on the socket
+                return f"Error: response too large ({length} bytes)"
+
+            payload = _recv_exact(s, length)
         except socket.timeout:
-            return "Error: connect timed out (daemon may be overloaded)"
-        except ConnectionRefusedError:
-            return "Error: Fold daemon refused connection."
-
-        req_id = uuid.uuid4().hex[:8]
-        escaped = expression.replace('\\', '\\\\').replace('"', '\\"')
-        msg = f'((type . request) (id . "{req_id}") (session . "{session_id}") (expr . "{escaped}"))'
-        data = msg.encode("utf-8")
-
-        s.sendall(struct.pack(">I", len(data)) + data)
-
-        # Phase 2: Evaluation — use the caller's timeout for actual computation
-        s.settimeout(timeout)
-        length_bytes = _recv_exact(s, 4)
-        length = struct.unpack(">I", length_bytes)[0]
-        if length > max_response_bytes:
-            return f"Error: response too large ({length} bytes)"
-
-        payload = _recv_exact(s, length)
-        resp = _parse_response(payload.decode("utf-8"))
-
-        if resp["status"] == "success":
-            _daemon_generation[session_id] = _daemon_pid_mtime()
-
-            result = resp.get("result", "(no result)")
-            if len(result) > max_result_length:
-                result = result[:max_result_length] + f"\n(truncated — {len(result)} chars total)"
-            return result
-        else:
-            return f"Error: {resp.get('error', 'unknown')}"
+            _drop_conn(session_id)  # reply may still arrive — don't reuse
+            return f"Error: eval {timeout_label} after {timeout}s"
+        except Exception as e:
+            _drop_conn(session_id)
+            return f"Error: {e}"
 
-    except socket.timeout:
-        return f"Error: eval {timeout_label} after {timeout}s"
-    except Exception as e:
-        return f"Error: {e}"
-    finally:
-        s.close()
+    return _decode_reply(payload, session_id, max_result_length)
 
 
 def evaluate(expression: str, session_id: str, timeout: float = 30.0) -> str:
@@ -218,3 +534,67 @@ def evaluate_long(expression: str, session_id: str, timeout: float = 300.0) -> s
     return _evaluate_impl(expression, session_id, timeout,
                           MAX_RESULT_LENGTH_LONG, 64 * 1024 * 1024,
                           "RLM run timed out")
+
+
+def evaluate_many(expressions: list[str], session_id: str, timeout: float = 30.0) -> list[str]:
+    """Evaluate several expressions in one session, pipelined over one connection.
+
+    All request frames go out in a single write on the session's persistent
+    connection and the daemon answers them in order, so N evaluations cost one
+    send instead of N round-trips. Results match evaluate(). If the batch fails
+    partway (timeout, oversized reply, dropped connection), the unanswered
+    expressions were already sent and may have run, so they are reported as
+    outcome unknown rather than retried.
+    """
+    if len(expressions) < 2:
+        return [evaluate(expr, session_id, timeout) for expr in expressions]
+
+    sock_path = _ensure_daemon()
+    if not sock_path:
+        return ["Error: Fold daemon is not running and could not be started."] * len(expressions)
+
+    frames = [buf for expr in expressions for buf in _encode_request(expr, session_id)]
+    results: list[str] = []
+    _generation_synced.discard(session_id)
+
+    with _session_lock(session_id):
+        for _attempt in range(2):
+            try:
+                s, reused = _get_conn(session_id, sock_path)
+            except socket.timeout:
+                return ["Error: connect timed out (daemon may be overloaded)"] * len(expressions)
+            except ConnectionRefusedError:
+                return ["Error: Fold daemon refused connection."] * len(expressions)
+
+            s.settimeout(timeout)
+            try:
+                _send_buffers(s, frames)
+                for _ in expressions:
+                    length = struct.unpack(">I", _recv_exact(s, 4))[0]
+                    if length > 16 * 1024 * 1024:
+                        _drop_conn(session_id)
+                        results.append(f"Error: response too large ({length} bytes)")
+                        break
+                    payload = _recv_exact(s, length)
+                    results.append(_decode_reply(payload, session_id, MAX_RESULT_LENGTH))
+                break
+            except socket.timeout:
+                _drop_conn(session_id)
+                results.append(f"Error: eval timed out after {timeout}s")
+                break
+            except OSError as e:
+                _drop_conn(session_id)
+                if results:
+                    results.append(f"Error: {e}")  # daemon hung up after serving some
+                    break
+                if not reused:
+                    return [f"Error: {e}"] * len(expressions)
+                # stale cached connection — retry the whole batch on a fresh one
+
+    # Anything still unanswered was already sent, so re-running it could
+    # apply its side effects twice
+    results += [
+        "Error: outcome unknown — an earlier expression in the batch failed "
+        "after this one was sent; it may have run"
+    ] * (len(expressions) - len(results))
+    return results
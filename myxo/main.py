@@ -1,20 +1,22 @@
 """Entry point — creature discovery + onboarding + starts the server."""
 
-import glob
 import json
 import logging
 import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-import uvicorn
-from myxo.brain import Brain
 from myxo.config import config, get_creature_config
 from myxo.identity import load_identity_from, create_identity
-from myxo.provider import create_provider
-from myxo.server import create_app
+
+# Brain, the providers (openai/httpx), the server (fastapi) and uvicorn are
+# imported where they're first needed, so importing this module stays cheap
+if TYPE_CHECKING:
+    from myxo.brain import Brain
 
 logging.basicConfig(
     level=logging.INFO,
@@ -33,7 +35,34 @@ def _creature_id_from_box(box_path: str) -> str:
     return dirname
 
 
-def _discover_creatures() -> dict[str, Brain]:
+def _make_brain(creature_id: str, identity: dict, box_path: str) -> "Brain":
+    """Build a creature's brain with the provider from its config."""
+    from myxo.brain import Brain
+    from myxo.provider import create_provider
+
+    creature_cfg = get_creature_config(creature_id)
+    provider = create_provider(creature_cfg)
+    return Brain(identity, box_path, provider, creature_config=creature_cfg)
+
+
+def _build_creature(box_path: str) -> "tuple[str, Brain] | None":
+    """Load one box's identity and build its brain. None if it has no identity."""
+    identity = load_identity_from(box_path)
+    if not identity:
+        return None
+    creature_id = _creature_id_from_box(box_path)
+    return creature_id, _make_brain(creature_id, identity, box_path)
+
+
+def _onboard_creature() -> "tuple[str, Brain]":
+    """Run onboarding for a new creature and build its brain."""
+    identity = create_identity()
+    creature_id = identity["name"].lower()
+    box_path = os.path.join(PROJECT_ROOT, f"{creature_id}_box")
+    return creature_id, _make_brain(creature_id, identity, box_path)
+
+
+def _discover_creatures() -> "dict[str, Brain]":
     """Discover all *_box/ dirs, migrate legacy environment/, return brains dict."""
     brains: dict[str, Brain] = {}
 
@@ -48,19 +77,18 @@ def _discover_creatures() -> dict[str, Brain]:
         print(f"\n  Migrating environment/ -> {name}_box/...")
         shutil.move(legacy, new_path)
 
-    # Scan for *_box/ directories
-    pattern = os.path.join(PROJECT_ROOT, "*_box")
-    boxes = sorted(p for p in glob.glob(pattern) if os.path.isdir(p))
-
-    for box_path in boxes:
-        identity = load_identity_from(box_path)
-        if not identity:
-            continue
-        creature_id = _creature_id_from_box(box_path)
-        creature_cfg = get_creature_config(creature_id)
-        provider = create_provider(creature_cfg)
-        brain = Brain(identity, box_path, provider, creature_config=creature_cfg)
-        brains[creature_id] = brain
+    # Scan for *_box/ directories — scandir's d_type spares a stat per entry
+    with os.scandir(PROJECT_ROOT) as it:
+        boxes = sorted(e.path for e in it
+                       if e.name.endswith("_box") and not e.name.startswith(".") and e.is_dir())
+
+    # Boxes are independent — load identities and build providers in parallel
+    if boxes:
+        with ThreadPoolExecutor(max_workers=min(8, len(boxes))) as ex:
+            for built in ex.map(_build_creature, boxes):
+                if built:
+                    creature_id, brain = built
+                    brains[creature_id] = brain
 
     return brains
 
@@ -85,6 +113,9 @@ def _ensure_fold_env():
 
 
 if __name__ == "__main__":
+    import uvicorn
+    from myxo.server import create_app
+
     # Ensure Fold-side env for RLM provider
     _ensure_fold_env()
 
@@ -99,21 +130,11 @@ if __name__ == "__main__":
         except EOFError:
             answer = "n"
         if answer == "y":
-            identity = create_identity()
-            creature_id = identity["name"].lower()
-            box_path = os.path.join(PROJECT_ROOT, f"{creature_id}_box")
-            creature_cfg = get_creature_config(creature_id)
-            provider = create_provider(creature_cfg)
-            brain = Brain(identity, box_path, provider, creature_config=creature_cfg)
+            creature_id, brain = _onboard_creature()
             brains[creature_id] = brain
     else:
         print("\n  No creatures found. Let's create one!")
-        identity = create_identity()
-        creature_id = identity["name"].lower()
-        box_path = os.path.join(PROJECT_ROOT, f"{creature_id}_box")
-        creature_cfg = get_creature_config(creature_id)
-        provider = create_provider(creature_cfg)
-        brain = Brain(identity, box_path, provider, creature_config=creature_cfg)
+        creature_id, brain = _onboard_creature()
         brains[creature_id] = brain
 
     # Initialize the app with all brains
@@ -1,10 +1,13 @@
 """Smallville-inspired memory stream with three-factor retrieval."""
 
+import heapq
 import json
 import logging
 import math
 import os
 import re
+from array import array
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 
 from myxo.config import config
@@ -12,14 +15,54 @@ from myxo.prompts import IMPORTANCE_PROMPT
 
 logger = logging.getLogger("myxo.memory")
 
+# The whole stream is parsed at startup — use orjson when it's installed.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError.
+try:
+    import orjson
+
+    def _jsonl_line(entry) -> bytes:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _jsonl_line(entry) -> bytes:
+        return (json.dumps(entry) + "\n").encode()
+
+    _json_loads = json.loads
+
+# Cosine similarity runs against every memory on each retrieval — use numpy
+# (one matrix-vector product over unit vectors) when it's installed, the
+# pure-Python version otherwise.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 STREAM_FILENAME = "memory_stream.jsonl"
 STATE_FILENAME = "memory_state.json"
+# Embeddings as raw native-endian float32, appended in stream order. A stream
+# entry points into it with "embedding_at": [offset, dim] (in floats); entries
+# written before the sidecar existed still carry their "embedding" inline.
+EMBEDDINGS_FILENAME = "memory_embeddings.f32"
 
 # Retrieval weights — relevance-dominant so semantic search matters more than age
 W_RECENCY = 0.3
 W_IMPORTANCE = 0.2
 W_RELEVANCE = 0.5
 
+# First integer in the LLM's importance rating
+_INT_RE = re.compile(r'\d+')
+
+# Memory timestamps are naive local ISO strings; ages are differences from this
+_EPOCH = datetime(1970, 1, 1)
+
+# importance_sum is saved every this many adds (and whenever a reflection is
+# due or reset) rather than after each one
+STATE_SAVE_INTERVAL = 10
+
+# Query embeddings kept per stream (LRU) — repeated queries skip the provider
+QUERY_CACHE_SIZE = 128
+
 # Reflections get this multiplier on their retrieval score to prevent pollution
 REFLECTION_WEIGHT = 0.5
 
@@ -34,6 +77,28 @@ def _cosine_sim(a: list[float], b: list[float]) -> float:
     return dot / (norm_a * norm_b)
 
 
+def _unit_vector(embedding: list[float]):
+    """Embedding as a float32 unit vector, or None when empty or numpy is missing.
+
+    A zero vector stays zero, so its similarity comes out 0 as in _cosine_sim.
+    """
+    if np is None or not embedding:
+        return None
+    v = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(v)
+    return v / norm if norm else v
+
+
+def _put_row(buf, n: int, value):
+    """Store value at buf[n], doubling buf's capacity first if it's full; returns buf."""
+    if n >= len(buf):
+        grown = np.empty((max(2 * len(buf), n + 1, 16),) + buf.shape[1:], dtype=buf.dtype)
+        grown[:n] = buf[:n]
+        buf = grown
+    buf[n] = value
+    return buf
+
+
 class MemoryStream:
     """Append-only memory stream with recency × importance × relevance retrieval."""
 
@@ -41,28 +106,50 @@ class MemoryStream:
         self.env_path = environment_path
         self.path = os.path.join(environment_path, STREAM_FILENAME)
         self._state_path = os.path.join(environment_path, STATE_FILENAME)
+        self._embeddings_path = os.path.join(environment_path, EMBEDDINGS_FILENAME)
         self.provider = provider
         self.memories: list[dict] = []
+        self._vectors: list = []  # unit float32 embedding per memory (None if none), kept in step
+        self._timestamps: list[float] = []  # parsed "timestamp" per memory (seconds since _EPOCH, NaN if bad)
+        self._by_kind: defaultdict[str, list[int]] = defaultdict(list)  # kind -> indices into memories
+        # (dim, row indices, stacked vectors of that dim, rows in use) — buffers
+        # grow by doubling as add() appends; rebuilt only for a new query size
+        self._matrix = None
+        # (_timestamps, importance, is-reflection) as arrays built on the first
+        # ranked retrieve; add() appends to them, doubling when full
+        self._columns = None
         self.importance_sum: float = 0.0  # running sum since last reflection
         self._next_id: int = 0
+        self._adds_since_save: int = 0
+        # text -> embedding, LRU; seeded by add() since recent thoughts come back as queries
+        self._query_embeddings: OrderedDict[str, list[float]] = OrderedDict()
+        # Append handles for the stream and embeddings files, opened on first add()
+        self._stream_file = None
+        self._embeddings_file = None
         self._load()
 
     def _load(self):
         """Load existing memories from JSONL on startup."""
         if os.path.isfile(self.path):
             try:
-                with open(self.path, "r") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            entry = json.loads(line)
-                            self.memories.append(entry)
-                        except json.JSONDecodeError:
-                            logger.warning(f"Skipping corrupt memory entry")
+                # One read, then split — no per-line file iteration or decoding
+                with open(self.path, "rb") as f:
+                    data = f.read()
+                for line in data.split(b"\n"):
+                    if not line or line.isspace():
+                        continue
+                    try:
+                        entry = _json_loads(line)
+                        self.memories.append(entry)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping corrupt memory entry")
             except Exception as e:
                 logger.error(f"Failed to load memory stream: {e}")
+        self._load_embeddings()
+        self._vectors = [_unit_vector(m.get("embedding")) for m in self.memories]
+        self._timestamps = [self._timestamp_seconds(m) for m in self.memories]
+        for i, m in enumerate(self.memories):
+            self._by_kind[m.get("kind")].append(i)
 
         if self.memories:
             # Restore next ID from highest existing ID
@@ -84,6 +171,50 @@ class MemoryStream:
             f"(importance_sum={self.importance_sum:.1f})"
         )
 
+    def _load_embeddings(self):
+        """Fill in "embedding" for entries whose vector lives in the sidecar."""
+        refs = [m for m in self.memories if "embedding_at" in m]
+        if not refs:
+            return
+        floats = array("f")
+        try:
+            with open(self._embeddings_path, "rb") as f:
+                data = f.read()
+            floats.frombytes(memoryview(data)[:len(data) - len(data) % 4])
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Failed to load memory embeddings: {e}")
+        for m in refs:
+            try:
+                offset, dim = m.pop("embedding_at")
+            except (TypeError, ValueError):
+                offset, dim = 0, 0
+            # Missing (e.g. a torn write) reads as no embedding
+            m["embedding"] = floats[offset:offset + dim] if offset + dim <= len(floats) else []
+
+    def _append_embedding(self, embedding: list[float]) -> list[int]:
+        """Append an embedding to the sidecar; return its [offset, dim] in floats."""
+        f = self._embeddings_file
+        if f is None:
+            f = self._embeddings_file = open(self._embeddings_path, "ab")
+        end = f.seek(0, os.SEEK_END)
+        pad = -end % 4  # realign after a torn earlier write
+        f.write(b"\0" * pad + array("f", embedding).tobytes())
+        f.flush()
+        return [(end + pad) // 4, len(embedding)]
+
+    def close(self):
+        """Save state and close the append handles."""
+        self._save_state()
+        for f in (self._stream_file, self._embeddings_file):
+            if f is not None:
+                try:
+                    f.close()
+                except Exception as e:
+                    logger.error(f"Failed to close memory file: {e}")
+        self._stream_file = self._embeddings_file = None
+
     def _load_state(self):
         """Restore importance_sum and other state from sidecar JSON."""
         if not os.path.isfile(self._state_path):
@@ -97,6 +228,7 @@ class MemoryStream:
 
     def _save_state(self):
         """Persist importance_sum to sidecar JSON (atomic write)."""
+        self._adds_since_save = 0
         state = {"importance_sum": self.importance_sum}
         tmp = self._state_path + ".tmp"
         try:
@@ -119,9 +251,10 @@ class MemoryStream:
             logger.error(f"Embedding failed: {e}")
             embedding = []
 
+        now = datetime.now()
         entry = {
             "id": f"m_{self._next_id:04d}",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "kind": kind,
             "content": content,
             "importance": importance,
@@ -130,26 +263,49 @@ class MemoryStream:
             "embedding": embedding,
         }
 
+        self._by_kind[kind].append(len(self.memories))
         self.memories.append(entry)
+        if embedding:
+            self._remember_query(content, embedding)
+        self._vectors.append(_unit_vector(embedding))
+        self._timestamps.append((now - _EPOCH).total_seconds())
+        self._add_to_matrix(len(self.memories) - 1)
+        if self._columns is not None:
+            n = len(self.memories) - 1
+            self._columns = tuple(
+                _put_row(column, n, value)
+                for column, value in zip(self._columns, (self._timestamps[n], importance, kind == "reflection"))
+            )
         self._next_id += 1
         self.importance_sum += importance
-        self._save_state()
+        self._adds_since_save += 1
+        if self._adds_since_save >= STATE_SAVE_INTERVAL or self.should_reflect():
+            self._save_state()
 
-        # Append to JSONL file
+        # Append to JSONL file — the embedding itself goes to the float32 sidecar.
+        # Both handles stay open; each entry is flushed as it's written.
         try:
-            with open(self.path, "a") as f:
-                f.write(json.dumps(entry) + "\n")
+            record = entry
+            if embedding:
+                record = {k: v for k, v in entry.items() if k != "embedding"}
+                record["embedding_at"] = self._append_embedding(embedding)
+            if self._stream_file is None:
+                self._stream_file = open(self.path, "ab")
+            self._stream_file.write(_jsonl_line(record))
+            self._stream_file.flush()
         except Exception as e:
             logger.error(f"Failed to write memory: {e}")
 
         logger.info(f"Memory {entry['id']}: importance={importance}, kind={kind}")
         return entry
 
-    def retrieve(self, query: str, top_k: int = None) -> list[dict]:
+    def retrieve(self, query: str, top_k: int = None,
+                 older_than_seconds: float = 0) -> list[dict]:
         """Weighted three-factor retrieval: recency, importance, relevance.
 
         Scoring: W_RECENCY * recency + W_IMPORTANCE * importance + W_RELEVANCE * relevance
         Reflections are downweighted by REFLECTION_WEIGHT to prevent pollution.
+        Memories younger than older_than_seconds are skipped.
         """
         if top_k is None:
             top_k = config.get("memory_retrieval_count", 3)
@@ -160,25 +316,31 @@ class MemoryStream:
         # Embed the query
         query_embedding = []
         try:
-            query_embedding = self.provider.embed(query) if self.provider else []
+            query_embedding = self._embed_query(query)
         except Exception as e:
             logger.warning(f"Query embedding failed, falling back to recency: {e}")
+            if older_than_seconds:
+                now = (datetime.now() - _EPOCH).total_seconds()
+                return [m for i, m in enumerate(self.memories)
+                        if self._seconds_ago(i, now) > older_than_seconds][-top_k:]
             return self.memories[-top_k:]
 
         if not query_embedding:
             logger.warning("Empty query embedding — retrieval will be recency-only")
 
         decay_rate = config.get("recency_decay_rate", 0.995)
-        now = datetime.now()
+        if np is not None:
+            return self._rank(query_embedding, decay_rate, older_than_seconds, top_k)
+
+        now = (datetime.now() - _EPOCH).total_seconds()
         scored = []
 
-        for mem in self.memories:
+        for i, mem in enumerate(self.memories):
             # Recency score (exponential decay over hours)
-            try:
-                mem_time = datetime.fromisoformat(mem["timestamp"])
-                hours_ago = (now - mem_time).total_seconds() / 3600.0
-            except Exception:
-                hours_ago = 1000.0
+            seconds_ago = self._seconds_ago(i, now)
+            if seconds_ago <= older_than_seconds:
+                continue
+            hours_ago = seconds_ago / 3600.0
             recency = math.exp(-(1 - decay_rate) * hours_ago)
 
             # Importance score (normalized 0-1)
@@ -200,8 +362,106 @@ class MemoryStream:
 
             scored.append((score, mem))
 
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [mem for _, mem in scored[:top_k]]
+        # Same as a stable descending sort cut to top_k, without sorting it all
+        return [mem for _, mem in heapq.nlargest(top_k, scored, key=lambda x: x[0])]
+
+    def _embed_query(self, query: str) -> list[float]:
+        """Embedding for a retrieval query, from the LRU when this text was seen recently."""
+        embedding = self._query_embeddings.get(query)
+        if embedding is not None:
+            self._query_embeddings.move_to_end(query)
+            return embedding
+        embedding = self.provider.embed(query) if self.provider else []
+        self._remember_query(query, embedding)
+        return embedding
+
+    def _remember_query(self, text: str, embedding: list[float]):
+        self._query_embeddings[text] = embedding
+        self._query_embeddings.move_to_end(text)
+        if len(self._query_embeddings) > QUERY_CACHE_SIZE:
+            self._query_embeddings.popitem(last=False)
+
+    def _rank(self, query_embedding: list[float], decay_rate: float,
+              older_than_seconds: float, top_k: int) -> list[dict]:
+        """retrieve()'s scoring done over whole arrays (numpy only) — same ranking as the loop."""
+        if self._columns is None:
+            self._columns = (
+                np.array(self._timestamps),
+                np.array([m.get("importance", 0) for m in self.memories], dtype=np.float64),
+                np.array([m.get("kind") == "reflection" for m in self.memories], dtype=bool),
+            )
+        count = len(self.memories)
+        timestamps, importance, reflection = (column[:count] for column in self._columns)
+
+        now = (datetime.now() - _EPOCH).total_seconds()
+        seconds_ago = np.where(np.isnan(timestamps), 3_600_000.0, now - timestamps)
+        keep = np.flatnonzero(seconds_ago > older_than_seconds)
+
+        query_vector = _unit_vector(query_embedding)
+        if query_vector is not None:
+            relevance = self._similarities(query_vector)[keep]
+            # NaN: no vector of the query's size — score those the slow way
+            for j in np.flatnonzero(np.isnan(relevance)):
+                embedding = self.memories[keep[j]].get("embedding")
+                relevance[j] = max(0.0, _cosine_sim(query_embedding, embedding)) if embedding else 0.0
+        else:
+            relevance = np.zeros(len(keep))
+
+        recency = np.exp(-(1 - decay_rate) * (seconds_ago[keep] / 3600.0))
+        score = (W_RECENCY * recency
+                 + W_IMPORTANCE * (importance[keep] / 10.0)
+                 + W_RELEVANCE * relevance)
+        score[reflection[keep]] *= REFLECTION_WEIGHT
+
+        # Only the top_k scores (and any ties with the last of them) get sorted.
+        # Stable, so equal scores keep stream order like list.sort(reverse=True).
+        if 0 < top_k < len(score):
+            cut = len(score) - top_k
+            candidates = np.flatnonzero(score >= np.partition(score, cut)[cut])
+            keep, score = keep[candidates], score[candidates]
+        order = keep[np.argsort(-score, kind="stable")][:top_k]
+        return [self.memories[i] for i in order]
+
+    def _similarities(self, query_vector):
+        """Clipped cosine similarity of a unit query vector with every memory.
+
+        One matrix-vector product over the stacked unit vectors of the query's
+        size; memories without one get NaN.
+        """
+        dim = query_vector.shape[0]
+        if self._matrix is None or self._matrix[0] != dim:
+            rows = [i for i, v in enumerate(self._vectors) if v is not None and v.shape[0] == dim]
+            stacked = np.empty((max(len(rows), 16), dim), dtype=np.float32)
+            for n, i in enumerate(rows):
+                stacked[n] = self._vectors[i]
+            indices = np.zeros(len(stacked), dtype=np.intp)
+            indices[:len(rows)] = rows
+            self._matrix = (dim, indices, stacked, len(rows))
+        _, rows, stacked, n = self._matrix
+        sims = np.full(len(self.memories), np.nan)
+        sims[rows[:n]] = np.maximum(stacked[:n] @ query_vector, 0.0)
+        return sims
+
+    def _add_to_matrix(self, i: int):
+        """Append memory i's unit vector to the stacked matrix, if it has one of that size."""
+        v = self._vectors[i]
+        if self._matrix is None or v is None or v.shape[0] != self._matrix[0]:
+            return
+        dim, rows, stacked, n = self._matrix
+        self._matrix = (dim, _put_row(rows, n, i), _put_row(stacked, n, v), n + 1)
+
+    def _seconds_ago(self, i: int, now: float) -> float:
+        """Age of memory i at now (seconds since _EPOCH); unparseable timestamps count as very old."""
+        ts = self._timestamps[i]
+        return 3_600_000.0 if math.isnan(ts) else now - ts
+
+    @staticmethod
+    def _timestamp_seconds(mem: dict) -> float:
+        """A memory's naive timestamp as seconds since _EPOCH; NaN if unparseable."""
+        try:
+            return (datetime.fromisoformat(mem["timestamp"]) - _EPOCH).total_seconds()
+        except Exception:
+            return math.nan
 
     def should_reflect(self) -> bool:
         """Check if accumulated importance exceeds the reflection threshold."""
@@ -216,8 +476,8 @@ class MemoryStream:
     def get_recent(self, n: int = 10, kind: str | None = None) -> list[dict]:
         """Get the last N memories, optionally filtered by kind."""
         if kind:
-            filtered = [m for m in self.memories if m["kind"] == kind]
-            return filtered[-n:]
+            indices = self._by_kind.get(kind, [])
+            return [self.memories[i] for i in indices[-n:]]
         return self.memories[-n:]
 
     def _score_importance(self, content: str) -> int:
@@ -230,7 +490,7 @@ class MemoryStream:
                 instructions=IMPORTANCE_PROMPT,
             )
             # Extract the first integer from the response
-            match = re.search(r'\d+', result)
+            match = _INT_RE.search(result)
             if match:
                 score = int(match.group())
                 return max(1, min(10, score))
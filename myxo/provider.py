@@ -3,10 +3,24 @@
 import json
 import logging
 import re
+import threading
+import httpx
 import openai
 
 logger = logging.getLogger("myxo.provider")
 
+# Tool-call arguments are decoded on every call — use orjson when it's installed.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers stay the same.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# <think> block strippers for reasoning models served via Chat Completions
+_THINK_RE = re.compile(r'<think>.*?</think>\s*', re.DOTALL)
+_THINK_OPEN_RE = re.compile(r'<think>.*$', re.DOTALL)
+
 
 # --- Tool definitions ---
 
@@ -132,8 +146,9 @@ _FUNCTION_TOOLS = [
         "description": (
             "Dispatch a research helper to do multi-step work in the Fold. "
             "It loads modules, calls functions, traces dependencies, runs "
-            "experiments — whatever the task requires — across many steps, "
-            "then returns results. Takes a couple minutes.\n\n"
+            "experiments — whatever the task requires — across many steps. "
+            "It runs in the background for a couple of minutes: you get a run id "
+            "back right away, keep working, and collect the results with rlm_status.\n\n"
             "Use it when a task would take too many fold calls to do yourself, "
             "or when you want something explored while you think about other things.\n\n"
             "Examples:\n"
@@ -156,6 +171,22 @@ _FUNCTION_TOOLS = [
             "required": ["task"],
         },
     },
+    {
+        "name": "rlm_status",
+        "description": (
+            "Check on a background rlm run. While it's running you get its progress; "
+            "once it's finished you get its results. Defaults to your most recent run."
+        ),
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "run_id": {
+                    "type": "string",
+                    "description": "The run id rlm gave you (optional — defaults to the latest run)",
+                },
+            },
+        },
+    },
     {
         "name": "restart_fold",
         "description": (
@@ -205,6 +236,24 @@ _FUNCTION_TOOLS = [
 ]
 
 
+# Per-API tool schemas — built once, constant for the process lifetime
+_OPENAI_TOOLS = [{"type": "function", **t} for t in _FUNCTION_TOOLS]
+_LOCAL_TOOLS = [{"type": "function", "function": t} for t in _FUNCTION_TOOLS]
+
+
+_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=8, keepalive_expiry=120)
+
+
+def _http_client(uds: str | None = None) -> httpx.Client:
+    """Pooled HTTP client whose keep-alive outlasts the idle pause between think cycles.
+
+    uds: route requests over a Unix domain socket (e.g. vLLM on the same box).
+    """
+    if uds:
+        return openai.DefaultHttpxClient(transport=httpx.HTTPTransport(uds=uds, limits=_POOL_LIMITS))
+    return openai.DefaultHttpxClient(limits=_POOL_LIMITS)
+
+
 class Provider:
     """Base class — subclasses implement chat/embed for a specific API."""
 
@@ -232,8 +281,9 @@ class OpenAIProvider(Provider):
         self.api_key = api_key
         self.model = model
         self.embedding_model = embedding_model
-        self._chat_client = openai.OpenAI(api_key=api_key, timeout=120)
-        self._embed_client = openai.OpenAI(api_key=api_key, timeout=30)
+        self._chat_client = openai.OpenAI(api_key=api_key, timeout=120, http_client=_http_client())
+        # Same connection pool, shorter timeout
+        self._embed_client = self._chat_client.with_options(timeout=30)
 
     def _client(self, timeout: float = 120) -> openai.OpenAI:
         if timeout <= 30:
@@ -241,7 +291,7 @@ class OpenAIProvider(Provider):
         return self._chat_client
 
     def _tools(self):
-        return [{"type": "function", **t} for t in _FUNCTION_TOOLS]
+        return _OPENAI_TOOLS
 
     def chat(self, input_list, tools=True, instructions=None, max_tokens=300):
         kwargs = {
@@ -256,16 +306,13 @@ class OpenAIProvider(Provider):
 
         response = self._client().responses.create(**kwargs)
 
-        text_parts = []
+        text_parts = [content.text for item in response.output if item.type == "message"
+                      for content in item.content if hasattr(content, "text")]
         tool_calls = []
         for item in response.output:
-            if item.type == "message":
-                for content in item.content:
-                    if hasattr(content, "text"):
-                        text_parts.append(content.text)
-            elif item.type == "function_call":
+            if item.type == "function_call":
                 try:
-                    parsed_args = json.loads(item.arguments)
+                    parsed_args = _json_loads(item.arguments)
                 except (json.JSONDecodeError, TypeError) as exc:
                     logger.warning(f"Malformed tool call arguments for {item.name}: {item.arguments[:200]}")
                     parsed_args = {"_raw": item.arguments[:300], "_error": str(exc)}
@@ -296,104 +343,176 @@ class OpenAIProvider(Provider):
         }
 
 
+# --- Responses-format -> Chat Completions conversion (LocalProvider) ---
+
+def _convert_content_parts(parts):
+    """Convert Responses API multimodal parts to Chat Completions format."""
+    converted = []
+    for p in parts:
+        if isinstance(p, dict):
+            if p.get("type") == "input_text":
+                converted.append({"type": "text", "text": p["text"]})
+            elif p.get("type") == "text":
+                converted.append(p)
+            else:
+                # Pass through unknown parts as text
+                converted.append({"type": "text", "text": str(p)})
+        elif isinstance(p, str):
+            converted.append({"type": "text", "text": p})
+    return converted
+
+
+def _convert_message(item: dict) -> dict:
+    # Already a valid message — copy so the Brain's list is never mutated
+    return dict(item)
+
+
+def _convert_user_message(item: dict) -> dict:
+    msg = dict(item)
+    if isinstance(msg.get("content"), list):
+        # Multimodal content — convert from Responses to Completions format
+        msg["content"] = _convert_content_parts(msg["content"])
+    return msg
+
+
+def _convert_tool_output(item: dict) -> dict:
+    # Responses API tool result → Chat Completions tool message
+    return {"role": "tool", "tool_call_id": item["call_id"], "content": item["output"]}
+
+
+def _convert_local_assistant(item: dict) -> dict:
+    # Our own output from a previous turn
+    return item["_message"]
+
+
+def _convert_sdk_message(item) -> dict | None:
+    parts = [c.text for c in item.content if hasattr(c, "text")]
+    if parts:
+        return {"role": "assistant", "content": "\n".join(parts)}
+    return None
+
+
+def _convert_sdk_function_call(item) -> dict:
+    # Convert SDK function_call to assistant message with tool_calls
+    return {
+        "role": "assistant",
+        "content": None,
+        "tool_calls": [{
+            "id": item.call_id,
+            "type": "function",
+            "function": {
+                "name": item.name,
+                "arguments": item.arguments,
+            },
+        }],
+    }
+
+
+# Dict items are dispatched on the first (field, value) pair that matches
+_DICT_DISPATCH_FIELDS = ("role", "type", "_local_type")
+_DICT_HANDLERS = {
+    ("role", "user"): _convert_user_message,
+    ("role", "assistant"): _convert_message,
+    ("role", "system"): _convert_message,
+    ("role", "tool"): _convert_message,
+    ("type", "function_call_output"): _convert_tool_output,
+    ("_local_type", "assistant_with_tools"): _convert_local_assistant,
+}
+# SDK objects from OpenAI — shouldn't appear for local provider but handle gracefully
+_SDK_HANDLERS = {
+    "message": _convert_sdk_message,
+    "function_call": _convert_sdk_function_call,
+}
+
+
+def _convert_item(item) -> dict | None:
+    """Convert one input_list item to a Chat Completions message (None = skip)."""
+    if isinstance(item, dict):
+        for field in _DICT_DISPATCH_FIELDS:
+            handler = _DICT_HANDLERS.get((field, item.get(field)))
+            if handler:
+                return handler(item)
+        return None  # Skip unknown dict formats
+    try:
+        handler = _SDK_HANDLERS.get(item.type)
+    except AttributeError:
+        return None
+    return handler(item) if handler else None
+
+
 class LocalProvider(Provider):
     """Uses OpenAI-compatible Chat Completions API — for vLLM and similar."""
 
     def __init__(self, base_url: str, model: str, api_key: str = "not-needed",
                  embedding_api_key: str = None, embedding_model: str = "text-embedding-3-small",
-                 embedding_base_url: str = None):
+                 embedding_base_url: str = None, unix_socket: str = None):
         self.base_url = base_url
         self.model = model
         self.api_key = api_key
         self.embedding_api_key = embedding_api_key
         self.embedding_model = embedding_model
         self.embedding_base_url = embedding_base_url
-        self._chat_client = openai.OpenAI(base_url=base_url, api_key=api_key, timeout=120)
+        # Disable Qwen3 thinking mode for local vLLM — not needed for hosted APIs
+        self._is_local = any(h in base_url for h in ("localhost", "127.0.0.1", "192.168."))
+        self._extra_body = {"chat_template_kwargs": {"enable_thinking": False}} if self._is_local else None
+        # Converted-message cache for the current think cycle's input_list.
+        # The Brain only appends to that list, so each call converts just the
+        # new suffix; a different list (new cycle, compaction) starts over.
+        self._converted_lock = threading.Lock()
+        self._converted_for = None
+        self._converted_instructions = None
+        self._converted_cache = []
+        self._converted_upto = 0
+        self._converted_last = None
+        self._chat_client = openai.OpenAI(base_url=base_url, api_key=api_key, timeout=120,
+                                          http_client=_http_client(unix_socket))
+        self._embed_client = None
+        if embedding_api_key:
+            if embedding_base_url == base_url and embedding_api_key == api_key:
+                self._embed_client = self._chat_client.with_options(timeout=30)
+            else:
+                kwargs = {"api_key": embedding_api_key, "timeout": 30, "http_client": _http_client()}
+                if embedding_base_url:
+                    kwargs["base_url"] = embedding_base_url
+                self._embed_client = openai.OpenAI(**kwargs)
 
     def _client(self, timeout: float = 120) -> openai.OpenAI:
         return self._chat_client
 
     def _tools(self):
         """Chat Completions format for tool definitions."""
-        return [
-            {
-                "type": "function",
-                "function": t,
-            }
-            for t in _FUNCTION_TOOLS
-        ]
+        return _LOCAL_TOOLS
 
     def _convert_input(self, input_list, instructions=None):
-        """Convert the Brain's input_list to Chat Completions messages."""
-        messages = []
-
-        if instructions:
-            messages.append({"role": "system", "content": instructions})
-
-        for item in input_list:
-            if isinstance(item, dict):
-                role = item.get("role")
-                if role in ("user", "assistant", "system", "tool"):
-                    # Already a valid message — might need content format fixup
-                    msg = dict(item)
-                    if role == "user" and isinstance(msg.get("content"), list):
-                        # Multimodal content — convert from Responses to Completions format
-                        msg["content"] = self._convert_content_parts(msg["content"])
+        """Convert the Brain's input_list to Chat Completions messages.
+
+        Reuses the previous conversion when input_list is the same list,
+        grown only by appends, under the same instructions.
+        """
+        with self._converted_lock:
+            upto = self._converted_upto
+            if (input_list is not self._converted_for
+                    or instructions != self._converted_instructions
+                    or len(input_list) < upto
+                    or (upto and input_list[upto - 1] is not self._converted_last)):
+                messages = []
+                if instructions:
+                    messages.append({"role": "system", "content": instructions})
+                upto = 0
+            else:
+                messages = self._converted_cache
+
+            for item in input_list[upto:]:
+                msg = _convert_item(item)
+                if msg is not None:
                     messages.append(msg)
-                elif item.get("type") == "function_call_output":
-                    # Responses API tool result → Chat Completions tool message
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": item["call_id"],
-                        "content": item["output"],
-                    })
-                elif item.get("_local_type") == "assistant_with_tools":
-                    # Our own output from a previous turn
-                    messages.append(item["_message"])
-                # Skip unknown dict formats
-            elif hasattr(item, "type"):
-                # SDK objects from OpenAI — shouldn't appear for local provider
-                # but handle gracefully
-                if item.type == "message":
-                    parts = []
-                    for c in item.content:
-                        if hasattr(c, "text"):
-                            parts.append(c.text)
-                    if parts:
-                        messages.append({"role": "assistant", "content": "\n".join(parts)})
-                elif item.type == "function_call":
-                    # Convert SDK function_call to assistant message with tool_calls
-                    messages.append({
-                        "role": "assistant",
-                        "content": None,
-                        "tool_calls": [{
-                            "id": item.call_id,
-                            "type": "function",
-                            "function": {
-                                "name": item.name,
-                                "arguments": item.arguments,
-                            },
-                        }],
-                    })
-
-        return messages
-
-    @staticmethod
-    def _convert_content_parts(parts):
-        """Convert Responses API multimodal parts to Chat Completions format."""
-        converted = []
-        for p in parts:
-            if isinstance(p, dict):
-                if p.get("type") == "input_text":
-                    converted.append({"type": "text", "text": p["text"]})
-                elif p.get("type") == "text":
-                    converted.append(p)
-                else:
-                    # Pass through unknown parts as text
-                    converted.append({"type": "text", "text": str(p)})
-            elif isinstance(p, str):
-                converted.append({"type": "text", "text": p})
-        return converted
+
+            self._converted_for = input_list
+            self._converted_instructions = instructions
+            self._converted_cache = messages
+            self._converted_upto = len(input_list)
+            self._converted_last = input_list[-1] if input_list else None
+            return messages
 
     def chat(self, input_list, tools=True, instructions=None, max_tokens=300):
         messages = self._convert_input(input_list, instructions)
@@ -403,9 +522,8 @@ class LocalProvider(Provider):
             "messages": messages,
             "max_tokens": max_tokens,
         }
-        # Disable Qwen3 thinking mode for local vLLM — not needed for hosted APIs
-        if "localhost" in self.base_url or "127.0.0.1" in self.base_url or "192.168." in self.base_url:
-            kwargs["extra_body"] = {"chat_template_kwargs": {"enable_thinking": False}}
+        if self._extra_body:
+            kwargs["extra_body"] = self._extra_body
         if tools:
             kwargs["tools"] = self._tools()
 
@@ -416,8 +534,9 @@ class LocalProvider(Provider):
         text = msg.content
         # Safety net: strip any <think> blocks that slip through
         if text:
-            text = re.sub(r'<think>.*?</think>\s*', '', text, flags=re.DOTALL)
-            text = re.sub(r'<think>.*$', '', text, flags=re.DOTALL)
+            if "<think>" in text:
+                text = _THINK_RE.sub('', text)
+                text = _THINK_OPEN_RE.sub('', text)
             text = text.strip() or None
         tool_calls = []
         output_items = []
@@ -427,7 +546,7 @@ class LocalProvider(Provider):
             tc_dicts = []
             for tc in msg.tool_calls:
                 try:
-                    parsed_args = json.loads(tc.function.arguments)
+                    parsed_args = _json_loads(tc.function.arguments)
                 except (json.JSONDecodeError, TypeError) as exc:
                     logger.warning(f"Malformed tool call arguments for {tc.function.name}: {tc.function.arguments[:200]}")
                     parsed_args = {"_raw": tc.function.arguments[:300], "_error": str(exc)}
@@ -463,13 +582,9 @@ class LocalProvider(Provider):
         }
 
     def embed(self, text):
-        if not self.embedding_api_key:
+        if not self._embed_client:
             return []
-        kwargs = {"api_key": self.embedding_api_key, "timeout": 30}
-        if self.embedding_base_url:
-            kwargs["base_url"] = self.embedding_base_url
-        client = openai.OpenAI(**kwargs)
-        response = client.embeddings.create(
+        response = self._embed_client.embeddings.create(
             model=self.embedding_model,
             input=text,
         )
@@ -495,6 +610,7 @@ def create_provider(creature_config: dict) -> Provider:
             embedding_api_key=creature_config.get("embedding_api_key") or creature_config.get("api_key"),
             embedding_model=creature_config.get("embedding_model", "text-embedding-3-small"),
             embedding_base_url=creature_config.get("embedding_base_url") or creature_config.get("base_url"),
+            unix_socket=creature_config.get("unix_socket"),
         )
     else:
         return OpenAIProvider(
@@ -41,6 +41,8 @@ async def lifespan(app: FastAPI):
     # Shutdown: stop all brains
     for brain in brains.values():
         brain.stop()
+    for brain in brains.values():
+        await brain.aclose()
 
 
 app = FastAPI(title="Myxo", lifespan=lifespan)
@@ -245,7 +247,7 @@ async def get_events(request: Request, limit: int = 100):
     brain = _get_brain(request)
     if not brain:
         return _NO_CREATURE
-    return brain.events[-limit:]
+    return list(brain.events)[-limit:]
 
 @app.get("/api/raw")
 async def get_raw(request: Request, limit: int = 20):
@@ -253,7 +255,7 @@ async def get_raw(request: Request, limit: int = 20):
     brain = _get_brain(request)
     if not brain:
         return _NO_CREATURE
-    return brain.api_calls[-limit:]
+    return list(brain.api_calls)[-limit:]
 
 @app.get("/api/status")
 async def get_status(request: Request):
@@ -0,0 +1,96 @@
+"""MemoryStream retrieval: the numpy ranking must match the pure-Python one."""
+
+import json
+import os
+import random
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from myxo import memory
+from myxo.memory import MemoryStream
+
+
+class FakeProvider:
+    """Deterministic embeddings keyed on the text; no network."""
+
+    def __init__(self, dim: int = 8):
+        self.dim = dim
+
+    def embed(self, text: str) -> list[float]:
+        rng = random.Random(text)
+        return [rng.uniform(-1, 1) for _ in range(self.dim)]
+
+    def chat_short(self, messages, instructions=None) -> str:
+        return "5"
+
+
+@unittest.skipIf(memory.np is None, "numpy not installed")
+class RankMatchesLoopTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.env = self._tmp.name
+        self.provider = FakeProvider()
+        rng = random.Random(7)
+        start = datetime.now() - timedelta(days=3)
+        entries = []
+        for i in range(60):
+            entries.append({
+                "id": f"m_{i:04d}",
+                "timestamp": (start + timedelta(minutes=rng.randint(0, 4000))).isoformat(),
+                "kind": rng.choice(["thought", "observation", "reflection"]),
+                "content": f"memory {i}",
+                "importance": rng.randint(1, 10),
+                "depth": 0,
+                "references": [],
+                "embedding": self.provider.embed(f"memory {i}"),
+            })
+        # Exact duplicates apart from id — their scores tie, so stream order decides
+        tied = dict(entries[10], content="memory 10")
+        for i in range(60, 66):
+            entries.append(dict(tied, id=f"m_{i:04d}"))
+        # No embedding, and an unparseable timestamp
+        entries.append(dict(entries[0], id="m_0066", embedding=[]))
+        entries.append(dict(entries[1], id="m_0067", timestamp="not a date"))
+        with open(os.path.join(self.env, memory.STREAM_FILENAME), "w") as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _both(self, stream: MemoryStream, query: str, top_k: int, older_than: float = 0):
+        ranked = [m["id"] for m in stream.retrieve(query, top_k=top_k, older_than_seconds=older_than)]
+        with mock.patch.object(memory, "np", None):
+            looped = [m["id"] for m in stream.retrieve(query, top_k=top_k, older_than_seconds=older_than)]
+        return ranked, looped
+
+    def test_same_ranking(self):
+        stream = MemoryStream(self.env, self.provider)
+        for query in ("memory 10", "memory 3", "something else"):
+            for top_k in (1, 3, 10, 100):
+                ranked, looped = self._both(stream, query, top_k)
+                self.assertEqual(ranked, looped, (query, top_k))
+
+    def test_ties_keep_stream_order(self):
+        stream = MemoryStream(self.env, self.provider)
+        ranked, looped = self._both(stream, "memory 10", 7)
+        self.assertEqual(ranked, looped)
+        self.assertEqual(ranked[:7], ["m_0010"] + [f"m_{i:04d}" for i in range(60, 66)])
+
+    def test_same_ranking_after_adds(self):
+        stream = MemoryStream(self.env, self.provider)
+        stream.retrieve("warm up", top_k=3)  # build the cached columns and matrix
+        for i in range(40):
+            stream.add(f"new memory {i}", kind="reflection" if i % 4 == 0 else "thought")
+            ranked, looped = self._both(stream, f"new memory {i // 2}", 5)
+            self.assertEqual(ranked, looped, i)
+        ranked, looped = self._both(stream, "memory 10", 10, older_than=60)
+        self.assertEqual(ranked, looped)
+        stream.close()
+
+
+if __name__ == "__main__":
+    unittest.main()